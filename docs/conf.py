@@ -3,8 +3,9 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-import os
 import sys
+from pathlib import Path
+
 import sphinx
 
 # -- Project information -----------------------------------------------------
@@ -24,9 +25,15 @@ extensions = ["sphinx.ext.autodoc", "sphinx.ext.napoleon", "sphinx.ext.coverage"
 templates_path = ['_templates']
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
-sys.path.insert(0, os.path.abspath(".."))
-sys.path.insert(0, os.path.abspath("../server"))
-sys.path.insert(0, os.path.abspath("../sdf-types"))
+_HERE = Path(__file__).resolve().parent
+for _p in dict.fromkeys(
+    (_HERE / d).resolve() for d in ("..", "../server", "../sdf-types")
+):
+    sys.path.insert(0, str(_p))
+
+# Third-party dependencies of the documented modules; these do not need to be
+# installed (or imported) to build the docs.
+autodoc_mock_imports = ["black", "pydantic", "requests", "yaml"]
 
 default_role = "any"
 autodoc_member_order = "bysource"
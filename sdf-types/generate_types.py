@@ -1,11 +1,19 @@
 """Generates Python and TypeScript code from type specification."""
-from typing import TypedDict, Union, Literal, Mapping, NoReturn
-from textwrap import dedent, indent
+from typing import Callable, TypedDict, Union, Literal, Mapping, NoReturn
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+import functools
+import io
+import keyword
 
 import yaml
 import black
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 TypeSpecification = Mapping[str, "NamedType"]
 """Top-level type of the type specification file."""
 
@@ -93,8 +101,7 @@ class ExpandedTypeDef(TypedDict, ExpandedTypeDefOptional):
 def get_typespecs() -> TypeSpecification:
     """Get type specification file."""
     try:
-        with open("./sdf.type.yaml") as fo:
-            return yaml.load(fo, Loader=yaml.Loader)
+        return yaml.load(Path("./sdf.type.yaml").read_bytes(), Loader=_YamlLoader)
     except FileNotFoundError as e:
         raise Exception("Please run in sdf-types/.") from e
 
@@ -139,21 +146,23 @@ def union_to_ts(args: list[str]) -> str:
     return " | ".join(args)
 
 
+_TS_DISPATCH: Mapping[str, Callable[[list[str]], str]] = {
+    "_array": array_to_ts,
+    "_mapping": mapping_to_ts,
+    "_union": union_to_ts,
+}
+"""Handlers for the `ExpandedTypeDef._type` values which take arguments"""
+
+
 def record_type_to_ts(rt: TypeDef) -> str:
     """Generate TypeScript interface member type string."""
+    # Most members are bare type names, which need no further processing.
     if isinstance(rt, str):
-        _type = rt
-        _args = []
-    else:
-        _type = rt["_type"]
-        _args = rt.get("_args", [])
-    if _type == "_array":
-        return array_to_ts(_args)
-    if _type == "_mapping":
-        return mapping_to_ts(_args)
-    if _type == "_union":
-        return union_to_ts(_args)
-    return _type
+        return rt
+    _type = rt["_type"]
+    _args = rt.get("_args", [])
+    handler = _TS_DISPATCH.get(_type)
+    return handler(_args) if handler else _type
 
 
 def expand_record_type(rt: TypeDef) -> ExpandedTypeDef:
@@ -163,52 +172,54 @@ def expand_record_type(rt: TypeDef) -> ExpandedTypeDef:
     return rt
 
 
-def named_type_to_ts(name: str, nt: NamedType) -> str:
-    """Generate TypeScript for top-level named type."""
-    _type = nt["_type"]
-    prefix = f"export type {name} ="
-    if _type == "_record":
-        types = []
-        for k, rt in nt["_kwargs"].items():
-            ert = expand_record_type(rt)
-            opt_str = "?" if ert.get("_optional", False) else ""
-            types.append(f'"{k}"{opt_str}: {record_type_to_ts(rt)};')
-        types_str = indent("\n".join(types), "  ")
-        _intersection: list[str] = nt.get("_intersection", [])
-        intersection_str = ""
-        if _intersection:
-            intersection_str = f" & {' & '.join(_intersection)}"
-        return f"{prefix} {{\n{types_str}\n}}{intersection_str};\n"
-    elif _type == "_literal_union":
-        # Great proposal from
-        # https://danielbarta.com/literal-iteration-typescript/
-        arg_strs = ", ".join(f'"{t}"' for t in nt["_args"])
-        type_values = f"export const {name}Values = [{arg_strs}] as const;"
-        type_str = f"export type {name} = typeof {name}Values[number];"
-        return type_values + "\n" + type_str + "\n"
-    elif _type == "_union":
-        return f"{prefix} {union_to_ts(nt['_args'])};\n"
-    elif _type == "_newtype":
-        # // type SchemaId = string & { readonly __tag: unique symbol };
-        return f"{prefix} {nt['_args'][0]} & {{ readonly __tag: unique symbol }};\n"
-    elif _type == "_array":
-        return f'{prefix} {array_to_ts(nt.get("_args", []))}'
-    elif _type == "_mapping":
-        return f'{prefix} {mapping_to_ts(nt.get("_args", []))}'
-    raise ValueError(f"Unhandled type: {_type}")
-
-
-def write_typescript(ts: TypeSpecification) -> None:
-    """Generate TypeScript file according to a type specification."""
-    tss_str = [named_type_to_ts(name, ts) for name, ts in ts.items()]
-    tss_str_fmtd = "\n".join(tss_str)
-    out_str = (
-        "// Autogenerated file.  Do not edit.\n"
-        "// See sdf-types/\n\n"
-        f"{tss_str_fmtd}"
-    )
-    with open("../client/src/types/Sdf.ts", "w") as fo:
-        fo.write(out_str)
+def _record_to_ts(out: io.StringIO, name: str, nt: NamedType) -> None:
+    out.write(f"export type {name} = {{\n")
+    for k, rt in nt["_kwargs"].items():
+        ert = expand_record_type(rt)
+        opt_str = "?" if ert.get("_optional", False) else ""
+        out.write(f'  "{k}"{opt_str}: {record_type_to_ts(rt)};\n')
+    out.write("}")
+    _intersection: list[str] = nt.get("_intersection", [])
+    if _intersection:
+        out.write(f" & {' & '.join(_intersection)}")
+    out.write(";\n")
+
+
+def _literal_union_to_ts(out: io.StringIO, name: str, nt: NamedType) -> None:
+    # Great proposal from
+    # https://danielbarta.com/literal-iteration-typescript/
+    arg_strs = ", ".join(f'"{t}"' for t in nt["_args"])
+    out.write(f"export const {name}Values = [{arg_strs}] as const;\n")
+    out.write(f"export type {name} = typeof {name}Values[number];\n")
+
+
+def _union_to_ts(out: io.StringIO, name: str, nt: NamedType) -> None:
+    out.write(f"export type {name} = {union_to_ts(nt['_args'])};\n")
+
+
+def _newtype_to_ts(out: io.StringIO, name: str, nt: NamedType) -> None:
+    # // type SchemaId = string & { readonly __tag: unique symbol };
+    tag_str = "{ readonly __tag: unique symbol }"
+    out.write(f"export type {name} = {nt['_args'][0]} & {tag_str};\n")
+
+
+def _array_to_ts(out: io.StringIO, name: str, nt: NamedType) -> None:
+    out.write(f'export type {name} = {array_to_ts(nt.get("_args", []))}')
+
+
+def _mapping_to_ts(out: io.StringIO, name: str, nt: NamedType) -> None:
+    out.write(f'export type {name} = {mapping_to_ts(nt.get("_args", []))}')
+
+
+_NAMED_TS_DISPATCH: Mapping[str, Callable[[io.StringIO, str, NamedType], None]] = {
+    "_record": _record_to_ts,
+    "_literal_union": _literal_union_to_ts,
+    "_union": _union_to_ts,
+    "_newtype": _newtype_to_ts,
+    "_array": _array_to_ts,
+    "_mapping": _mapping_to_ts,
+}
+"""Writers for each `NamedType._type`"""
 
 
 _PY_TYPES = {
@@ -219,6 +230,7 @@ _PY_TYPES = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def py_type(t: str) -> str:
     """Get Python type for type string."""
     return _PY_TYPES.get(t, t)
@@ -264,76 +276,128 @@ def mapping_to_py(args: list[str]) -> str:
     return f"dict[{', '.join(py_type(a) for a in args)}]"
 
 
+_PY_DISPATCH: Mapping[str, Callable[[list[str]], str]] = {
+    "_array": array_to_py,
+    "_mapping": mapping_to_py,
+    "_union": union_to_py,
+}
+"""Handlers for the `ExpandedTypeDef._type` values which take arguments"""
+
+
 def record_type_to_py(rt: TypeDef) -> str:
     """Generate Python TypeDict member type string."""
+    # Most members are bare type names, which need no further processing.
     if isinstance(rt, str):
-        _type = py_type(rt)
-        _args = []
-    else:
-        _type = py_type(rt["_type"])
-        _args = rt.get("_args", [])
-    if _type == "_array":
-        return array_to_py(_args)
-    if _type == "_mapping":
-        return mapping_to_py(_args)
-    if _type == "_union":
-        return f"{union_to_py(_args)}"
-    return _type
-
-
-def named_type_to_py(name: str, nt: NamedType) -> str:
-    """Generate Python for top-level named type."""
+        return py_type(rt)
+    _type = py_type(rt["_type"])
+    _args = rt.get("_args", [])
+    handler = _PY_DISPATCH.get(_type)
+    return handler(_args) if handler else _type
+
+
+def _record_to_py(out: io.StringIO, name: str, nt: NamedType) -> None:
+    parts = (f"_{name}Total", True), (f"_{name}Optional", False)
+    # Copy rather than append to the list from the spec so that emitting a type
+    # does not mutate it.
+    bases = [*nt.get("_intersection", ()), *(n for n, _ in parts)]
+    for n, total in parts:
+        fields = [
+            (k, record_type_to_py(rt))
+            for k, rt in nt["_kwargs"].items()
+            if expand_record_type(rt).get("_optional", False) == (not total)
+        ]
+        # JSON-LD keys such as "@id" can only be declared with the functional
+        # syntax.
+        if all(k.isidentifier() and not keyword.iskeyword(k) for k, _ in fields):
+            out.write(f"class {n}(TypedDict, total={total}):\n")
+            for k, typ in fields:
+                out.write(f"    {k}: {typ!r}\n")
+            if not fields:
+                out.write("    pass\n")
+        else:
+            fields_str = ", ".join(f"{k!r}: {typ!r}" for k, typ in fields)
+            out.write(f'{n} = TypedDict("{n}", {{{fields_str}}}, total={total})\n')
+    out.write(f"class {name}({', '.join(bases)}):\n    pass\n")
+
+
+def _literal_union_to_py(out: io.StringIO, name: str, nt: NamedType) -> None:
+    union_str = ", ".join(f'"{py_type(t)}"' for t in nt["_args"])
+    out.write(f"{name} = Literal[{union_str}]\n")
+
+
+def _union_to_py(out: io.StringIO, name: str, nt: NamedType) -> None:
+    out.write(f"{name} = {union_to_py(nt['_args'])}\n")
+
+
+def _newtype_to_py(out: io.StringIO, name: str, nt: NamedType) -> None:
+    typ = py_type(nt["_args"][0])
+    out.write(f'{name} = NewType("{name}", {typ})\n""""""\n')
+
+
+def _array_to_py(out: io.StringIO, name: str, nt: NamedType) -> None:
+    out.write(f'{name} = {array_to_py(nt.get("_args", []))}')
+
+
+def _mapping_to_py(out: io.StringIO, name: str, nt: NamedType) -> None:
+    out.write(f'{name} = {mapping_to_py(nt.get("_args", []))}')
+
+
+_NAMED_PY_DISPATCH: Mapping[str, Callable[[io.StringIO, str, NamedType], None]] = {
+    "_record": _record_to_py,
+    "_literal_union": _literal_union_to_py,
+    "_union": _union_to_py,
+    "_newtype": _newtype_to_py,
+    "_array": _array_to_py,
+    "_mapping": _mapping_to_py,
+}
+"""Writers for each `NamedType._type`"""
+
+
+def emit(name: str, nt: NamedType, ts_out: io.StringIO, py_out: io.StringIO) -> None:
+    """Write TypeScript and Python for top-level named type."""
     _type = nt["_type"]
-    prefix = f"{name} ="
-    if _type == "_record":
-        _intersection: list[str] = nt.get("_intersection", [])
-        out_str = ""
-        for n, total in (f"_{name}Total", True), (f"_{name}Optional", False):
-            fields = {}
-            for k, rt in nt["_kwargs"].items():
-                ert = expand_record_type(rt)
-                if ert.get("_optional", False) != (not total):
-                    continue
-                fields[k] = record_type_to_py(rt)
-            out_str += f'{n} = TypedDict("{n}", {fields}, total={total})\n'
-            _intersection.append(n)
-        intersection_str = f"{', '.join(_intersection)}"
-        return out_str + f"class {name}({intersection_str}):\n    pass\n"
-    elif _type == "_literal_union":
-        union_str = ", ".join(f'"{py_type(t)}"' for t in nt["_args"])
-        return f"{prefix} Literal[{union_str}]\n"
-    elif _type == "_union":
-        return f"{prefix} {union_to_py(nt['_args'])}\n"
-    elif _type == "_newtype":
-        typ = py_type(nt["_args"][0])
-        return f'{prefix} NewType("{name}", {typ})\n""""""\n'
-    elif _type == "_array":
-        return f'{prefix} {array_to_py(nt.get("_args", []))}'
-    elif _type == "_mapping":
-        return f'{prefix} {mapping_to_py(nt.get("_args", []))}'
-    raise ValueError(f"Unhandled type: {_type}")
-
-
-def write_python(ts: TypeSpecification) -> None:
-    """Generate Python file according to a type specification."""
-    tss_str = [named_type_to_py(name, ts) for name, ts in ts.items()]
-    tss_str_fmtd = "\n".join(tss_str)
-    out_str = (
-        "# Autogenerated file.  Do not edit.\n"
-        "# See sdf-types/\n\n"
-        "from typing import NewType, Literal, Union, TypedDict, Any\n\n"
-        f"{tss_str_fmtd}"
-    )
-    fn = Path("../server/openera/sdf.py")
-    with fn.open("w") as fo:
-        fo.write(out_str)
-    black.format_file_in_place(fn, False, black.Mode(), write_back=black.WriteBack.YES)
+    if _type not in _NAMED_TS_DISPATCH:
+        raise ValueError(f"Unhandled type: {_type}")
+    _NAMED_TS_DISPATCH[_type](ts_out, name, nt)
+    _NAMED_PY_DISPATCH[_type](py_out, name, nt)
+
+
+def write_typescript(ts_src: str) -> None:
+    """Write generated TypeScript file."""
+    Path("../client/src/types/Sdf.ts").write_bytes(ts_src.encode("utf-8"))
+
+
+def write_python(py_src: str) -> None:
+    """Format and write generated Python file."""
+    formatted = black.format_str(py_src, mode=black.Mode())
+    Path("../server/openera/sdf.py").write_bytes(formatted.encode("utf-8"))
 
 
 def main() -> None:
     ts = get_typespecs()
-    write_typescript(ts)
-    write_python(ts)
+    ts_out = io.StringIO()
+    py_out = io.StringIO()
+    ts_out.write("// Autogenerated file.  Do not edit.\n// See sdf-types/\n\n")
+    py_out.write(
+        "# Autogenerated file.  Do not edit.\n"
+        "# See sdf-types/\n\n"
+        "from typing import NewType, Literal, Union, TypedDict, Any\n\n"
+    )
+    # Both files are generated in a single pass over the specification.
+    for i, (name, nt) in enumerate(ts.items()):
+        if i:
+            ts_out.write("\n")
+            py_out.write("\n")
+        emit(name, nt, ts_out, py_out)
+    # The outputs are independent, so the TypeScript file can be written while
+    # black formats the Python.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(write_typescript, ts_out.getvalue()),
+            executor.submit(write_python, py_out.getvalue()),
+        ]
+        for future in futures:
+            future.result()
 
 
 if __name__ == "__main__":
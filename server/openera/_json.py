@@ -0,0 +1,91 @@
+"""JSON (de)serialization helpers
+
+``orjson`` is used when it is installed since it is considerably faster than
+the standard library ``json`` module; otherwise, fall back to the latter.
+``orjson`` is not a declared dependency of the server, so it is only used if
+it has been installed separately.
+
+The two backends produce the same data except that ``orjson`` does not emit
+whitespace between separators and only supports an indent of two spaces.
+``orjson`` is stricter than ``json``, so anything it cannot represent exactly
+is handed to ``json`` instead: ``NaN``/``Infinity``, lone surrogates (e.g.,
+``"\\ud800"``), and integers too wide for 64 bits (which ``orjson`` would
+otherwise decode as floats).
+
+"""
+from __future__ import annotations
+
+from typing import Any, cast
+import json
+import math
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+JSONDecodeError = json.JSONDecodeError
+"""Raised when decoding invalid JSON (``orjson``'s error subclasses this)"""
+
+# Any integer which could be wider than 64 bits has at least 20 digits, so
+# look for such a run by mapping ASCII digits to b"0" and all else to b"x".
+# Runs of digits elsewhere (strings, fractions) only cost a slower decode.
+_DIGITS_TABLE = bytes(0x30 if 0x30 <= i <= 0x39 else 0x78 for i in range(256))
+_LONG_DIGITS = b"0" * 20
+
+
+def _has_long_digits(s: str | bytes) -> bool:
+    """Return whether a document may contain an integer wider than 64 bits."""
+    if isinstance(s, str):
+        s = s.encode("utf-8", "surrogatepass")
+    return _LONG_DIGITS in s.translate(_DIGITS_TABLE)
+
+
+def loads(s: str | bytes) -> Any:
+    """Deserialize a JSON document."""
+    if _HAS_ORJSON and not _has_long_digits(s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
+
+
+def _has_nonfinite(obj: object) -> bool:
+    """Return whether an object contains a ``NaN`` or infinite float."""
+    stack = [obj]
+    while stack:
+        x = stack.pop()
+        t = type(x)
+        if t is dict:
+            stack.extend(cast(dict[Any, Any], x).values())
+        elif t is list or t is tuple:
+            stack.extend(cast(list[Any], x))
+        elif isinstance(x, float) and not math.isfinite(x):
+            return True
+    return False
+
+
+def dumpb(obj: object, *, indent: int | None = None) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON."""
+    if _HAS_ORJSON:
+        try:
+            data = orjson.dumps(
+                obj, option=orjson.OPT_INDENT_2 if indent is not None else 0
+            )
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            # orjson writes non-finite floats as null
+            if b"null" not in data or not _has_nonfinite(obj):
+                return data
+    return json.dumps(obj, indent=indent).encode()
+
+
+def dumps(obj: object, *, indent: int | None = None) -> str:
+    """Serialize an object to a JSON string."""
+    if _HAS_ORJSON:
+        return dumpb(obj, indent=indent).decode()
+    return json.dumps(obj, indent=indent)
@@ -6,8 +6,6 @@ from pathlib import Path
 from typing import Optional
 from typing_extensions import TypedDict
 
-logging.basicConfig(format="%(levelname)s: %(msg)s")
-
 
 class Config(TypedDict):
     """Python types for global config"""
@@ -32,13 +30,13 @@ def get_config() -> Config:
         Raised if the config file cannot be found
 
     """
+    logging.basicConfig(format="%(levelname)s: %(msg)s")
     era_mode = os.environ.get("ERA_MODE", None)
     if era_mode == "dev":
         client_version = None
     else:
         try:
-            with open("client-version") as fo:
-                client_version = fo.read().rstrip()
+            client_version = Path("client-version").read_text().rstrip()
         except FileNotFoundError as e:
             logging.error('Could not find "client-version" file.')
             raise e
@@ -7,7 +7,8 @@ as this file should abstract that entirely.
 from __future__ import annotations
 
 import sqlite3
-from datetime import datetime
+import threading
+import time
 from typing import (
     Any,
     Iterator,
@@ -25,17 +26,19 @@ from typing import (
     Tuple,
 )
 import gzip
-import json
+import itertools
+import os
+import functools
 from pathlib import Path
 from contextlib import contextmanager
-import re
-import itertools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import io
 import zipfile
 import hashlib
 
 import falcon
 
+from . import _json
 from . import sdf
 from . import util
 from .config import get_config
@@ -119,16 +122,51 @@ TABLES = [
     ("wd_node", WikidataTableRow),
 ]
 
-_con: sqlite3.Connection | None = None
+INDEXES = [
+    # Quarantined schemas are rare, so only index those; ``atId`` is the
+    # primary key and hence already indexed.
+    "schema_quarantined ON schema (quarantined) WHERE quarantined = 1",
+]
+
+_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "cache_size=-64000",
+    "mmap_size=268435456",
+)
+"""Applied once to each new connection
+
+WAL lets readers proceed concurrently with the (single) writer, which is what
+the threaded server needs; the remaining pragmas keep the page cache and
+temporary tables in memory.
+
+"""
+
+_tls = threading.local()
 
 
 def _get_connection() -> sqlite3.Connection:
-    """Get the per-thread preconfigured connection."""
-    global _con
-    if _con is None:
-        _con = sqlite3.connect(get_db_file(), timeout=DB_CONNECTION_TIMEOUT)
-        _con.row_factory = sqlite3.Row
-    return _con
+    """Get the per-thread preconfigured connection.
+
+    Notes
+    -----
+    The connection is in autocommit mode (``isolation_level=None``), so
+    transactions are controlled explicitly (see `do_transaction`).
+
+    """
+    con: sqlite3.Connection | None = getattr(_tls, "con", None)
+    if con is None:
+        con = sqlite3.connect(
+            get_db_file(), timeout=DB_CONNECTION_TIMEOUT, isolation_level=None
+        )
+        con.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            con.execute(f"PRAGMA {pragma}")
+        _tls.con = con
+        # Cached results belong to the previous connection's database
+        _tls.summaries = None
+    return con
 
 
 def execute(
@@ -166,6 +204,51 @@ def execute(
     return rows
 
 
+def iter_execute(
+    sql: str,
+    params: Sequence[SqlPrimitive] | Mapping[str, SqlPrimitive] | None = None,
+) -> Iterator[sqlite3.Row]:
+    """Execute a low-level query and lazily yield the resulting rows.
+
+    Unlike `execute`, rows are not all fetched into memory at once, so this
+    is preferable for scans over the whole ``Schema`` table.  The query runs
+    on its own cursor of the thread's connection, so it participates in any
+    open transaction.
+
+    Parameters
+    ----------
+    sql : str
+        Statement to be executed.
+    params : Sequence[SqlPrimitive] | Mapping[str, SqlPrimitive], optional
+        Parameters to be inserted in the SQL statement.
+
+    Yields
+    ------
+    sqlite3.Row
+        Result of the query
+
+    """
+    cursor = _get_connection().cursor()
+    if params is None:
+        params = []
+    try:
+        yield from cursor.execute(sql, params)
+    finally:
+        cursor.close()
+
+
+_JSON_EACH_EVENT = (
+    "json_each(CASE json_type(data, '$.events')"
+    " WHEN 'array' THEN json_extract(data, '$.events')"
+    " ELSE json_array(json_extract(data, '$.events')) END)"
+)
+"""Table-valued SQL expression over the events of a ``Schema`` row
+
+This mirrors `util.ensure_list` since ``events`` may be a single event.
+
+"""
+
+
 class Transaction:
     """Aggregates DB editing functions which take place within a transaction
 
@@ -189,6 +272,14 @@ class Transaction:
 
         return execute(sql, params, cursor=self._cur)
 
+    def executemany(
+        self,
+        sql: str,
+        seq_of_params: Iterable[Sequence[Any] | Mapping[str, Any]],
+    ) -> None:
+        """Execute SQL statement within transaction for each set of parameters."""
+        self._cur.executemany(sql, seq_of_params)
+
     def write_new_schema(self, sdf_data: sdf.Document) -> None:
         """Write a new schema to the database
 
@@ -208,7 +299,7 @@ class Transaction:
         )
         new_row: SchemasTableRow = {
             "atId": sdf_data["@id"],
-            "data": json.dumps(sdf_data),
+            "data": _json.dumps(sdf_data),
         }
         self._cur.execute(sql_insert, new_row)
 
@@ -263,13 +354,13 @@ class Transaction:
         if old_id == new_id:
             return
         # Ensure referential integrity
-        rows = self._cur.execute("SELECT data FROM Schema WHERE quarantined = 0")
-        all_schemas = [json.loads(r[0]) for r in rows]
-        referring_schemas = [
-            schema
-            for schema in all_schemas
-            if any(e.get("wd_node", None) == old_id for e in schema.get("events", []))
-        ]
+        sql_select = (
+            "SELECT data FROM Schema WHERE quarantined = 0 AND EXISTS "
+            f"(SELECT 1 FROM {_JSON_EACH_EVENT} "
+            "WHERE json_extract(value, '$.wd_node') = ?)"
+        )
+        rows = self.execute(sql_select, [old_id])
+        referring_schemas = [_json.loads(r[0]) for r in rows]
         # Make the transaction atomic by locking all schemas before
         # executing the name change.
         try:
@@ -279,7 +370,7 @@ class Transaction:
             e.description = f"Schema with @id {ref_data['@id']} refers to this schema and could not be locked."
             raise e
         for ref_data in referring_schemas:
-            for event in ref_data["events"]:
+            for event in ensure_list(ref_data["events"]):
                 if event.get("wd_node", None) == old_id:
                     event["wd_node"] = new_id
                     event["wd_label"] = new_id.split("/")[-1]
@@ -303,7 +394,7 @@ class Transaction:
         self._change_referring_schemas(schema_id, sdf_data["@id"], client_id)
         update_sql = "UPDATE Schema SET data=:data, atId=:dataAtId, quarantined=0 WHERE atId=:atId"
         params = {
-            "data": json.dumps(sdf_data),
+            "data": _json.dumps(sdf_data),
             "atId": schema_id,
             "dataAtId": sdf_data["@id"],
         }
@@ -342,7 +433,7 @@ def get_schema(schema_id: str, no_validate: bool = False) -> sdf.Document:
     rows = execute("SELECT data FROM Schema where atId=?", [schema_id])
     if rows:
         if no_validate:
-            return cast(sdf.Document, json.loads(rows[0][0]))
+            return cast(sdf.Document, _json.loads(rows[0][0]))
         else:
             return loads_sdf(rows[0][0])
     raise falcon.HTTPNotFound(
@@ -351,12 +442,57 @@ def get_schema(schema_id: str, no_validate: bool = False) -> sdf.Document:
     )
 
 
+def schema_exists(schema_id: str) -> bool:
+    """Return whether a schema (quarantined or not) exists.
+
+    This is cheaper than `get_schema` as the schema data is not read.
+
+    """
+    return bool(execute("SELECT 1 FROM Schema WHERE atId=?", [schema_id]))
+
+
+_SQL_SELECT_SUMMARIES = """
+    SELECT json_group_array(json_object(
+        'schemaId', atId,
+        'tags', CASE json_type(data, '$.privateData.eratosthenesTags')
+            WHEN 'array' THEN json_extract(data, '$.privateData.eratosthenesTags')
+            ELSE json_array()
+        END
+    ))
+    FROM Schema
+    WHERE quarantined=0
+"""
+
+
+_SummaryCache = Tuple[sqlite3.Connection, Tuple[int, int], bytes]
+
+
+def get_schema_summaries() -> bytes:
+    """Return the JSON-encoded list of non-quarantined schema summaries.
+
+    Notes
+    -----
+    The list is assembled by SQLite and cached per connection.  The cache is
+    invalidated whenever the database changes: ``PRAGMA data_version`` changes
+    when another connection commits and ``total_changes`` when this one does.
+    Neither identifies the database, so the cache also records the connection
+    it was built with and is cleared whenever a new connection is opened.
+
+    """
+    con = _get_connection()
+    key = (execute("PRAGMA data_version")[0][0], con.total_changes)
+    cached: _SummaryCache | None = getattr(_tls, "summaries", None)
+    if cached is not None and cached[0] is con and cached[1] == key:
+        return cached[2]
+    data = str(execute(_SQL_SELECT_SUMMARIES)[0][0]).encode()
+    _tls.summaries = (con, key, data)
+    return data
+
+
 def _tag_objects(s: str, objs: list[Any]) -> Any:
     """Inject metadata into objects."""
     for obj in objs:
-        private_data = obj.get("privateData", {})
-        private_data["originalDocumentId"] = s
-        obj["privateData"] = private_data
+        obj.setdefault("privateData", {})["originalDocumentId"] = s
     return objs
 
 
@@ -373,7 +509,7 @@ def _add_to_library(
         if not (remove_args and e.get("privateData", {}).get("isSchemaArg", False))
     ]
     for e in entities:
-        e.get("privateData", {})["isSchemaArg"] = False
+        e.setdefault("privateData", {})["isSchemaArg"] = False
     library["entities"] += _tag_objects(tag, entities)
     library["relations"] += _tag_objects(tag, ensure_list(schema.get("relations", [])))
     library["provenanceData"] += _tag_objects(
@@ -387,11 +523,9 @@ def inject_subschemas(lib: sdf.Document) -> None:
     events = ensure_list(lib["events"])
     while i < len(events):
         event = events[i]
-        if event.get("wd_node", "")[:4] == "cmu:":
-            rows = execute(
-                "SELECT data FROM Schema where atId=?",
-                [ensure_list(event["wd_node"])[0]],
-            )
+        wd_node = event.get("wd_node", "")
+        if isinstance(wd_node, str) and wd_node.startswith("cmu:"):
+            rows = execute("SELECT data FROM Schema where atId=?", [wd_node])
             if rows:
                 try:
                     subschema = loads_sdf(rows[0][0])
@@ -409,27 +543,28 @@ def inject_subschemas(lib: sdf.Document) -> None:
                 if e.get("privateData", {}).get("isSchemaArg", False)
             }
             unused_args = {a["@id"] for a in args.values()}
+            arg_subs: dict[str, str] = {}
             for p in ensure_list(event["participants"]):
-                util.sub_id(subschema, args[p["roleName"]]["@id"], p["entity"])
-                unused_args.remove(args[p["roleName"]]["@id"])
-
-            for e in ensure_list(subschema["events"]):
-                ps = ensure_list(e["participants"])
-                j = 0
-                while j < len(ps):
-                    if ps[j]["entity"] in unused_args:
-                        del ps[j]
-                    else:
-                        j += i
-                e["participants"] = ps
+                arg_id = args[p["roleName"]]["@id"]
+                arg_subs[arg_id] = p["entity"]
+                unused_args.remove(arg_id)
+            util.sub_ids(subschema, arg_subs)
+
+            sub_events = ensure_list(subschema["events"])
+            for e in sub_events:
+                e["participants"] = [
+                    p
+                    for p in ensure_list(e["participants"])
+                    if p["entity"] not in unused_args
+                ]
             del events[i]
 
             _add_to_library(lib, subschema, remove_args=True)
 
-            all_events = {e["@id"] for e in ensure_list(subschema["events"])}
+            all_events = {e["@id"] for e in sub_events}
             all_children = {
                 c["child"]
-                for e in ensure_list(subschema["events"])
+                for e in sub_events
                 for c in ensure_list(e.get("children", []))
             }
 
@@ -456,40 +591,51 @@ def _fix_children_gates(lib: sdf.Document) -> None:
             e["children_gate"] = "and"
 
 
-WIKI_PAT = re.compile(r"^wdt?:")
-CMU_PAT = re.compile(r"^cmu:")
+WIKI_PREFIXES = ("wd:", "wdt:")
+
 
+def _ensure_wd_values(obj: Any, wd_values: Mapping[str, Tuple[str, str]]) -> None:
+    """Ensure wd_label and wd_description are populated when wd_node is present.
 
-def _ensure_wd_values(obj: Any) -> None:
-    """Ensure wd_label and wd_description are populated when wd_node is present."""
+    ``wd_values`` must contain the (label, description) of every Wikidata node
+    referenced by ``obj`` (see `get_wikidata_values_many`).
+
+    """
     wd_node = obj.get("wd_node", "")
-    if WIKI_PAT.match(wd_node):
-        stripped = WIKI_PAT.sub("", wd_node)
-        label, desc = get_wikidata_values(stripped)
+    if wd_node.startswith(WIKI_PREFIXES):
+        label, desc = wd_values[wd_node.partition(":")[2]]
         obj["wd_label"] = label
         obj["wd_description"] = desc
-    elif CMU_PAT.match(wd_node):
+    elif wd_node.startswith("cmu:"):
         obj["wd_label"] = wd_node.split("/")[-1]
         obj["wd_description"] = obj["wd_label"]
         assert False
 
 
-def _fix_wd_values(lib: sdf.Document) -> None:
+def _iter_wd_objects(lib: sdf.Document) -> Iterator[Any]:
+    """Yield every object in the library which may have a ``wd_node``."""
     for event in ensure_list(lib["events"]):
-        _ensure_wd_values(event)
-        for participant in ensure_list(event.get("participants", [])):
-            _ensure_wd_values(participant)
-    for entity in ensure_list(lib["entities"]):
-        _ensure_wd_values(entity)
-    for relation in ensure_list(lib["relations"]):
-        _ensure_wd_values(relation)
+        yield event
+        yield from ensure_list(event.get("participants", []))
+    yield from ensure_list(lib["entities"])
+    yield from ensure_list(lib["relations"])
+
+
+def _fix_wd_values(lib: sdf.Document) -> None:
+    objs = list(_iter_wd_objects(lib))
+    wd_nodes = (obj.get("wd_node", "") for obj in objs)
+    wd_values = get_wikidata_values_many(
+        n.partition(":")[2] for n in wd_nodes if n.startswith(WIKI_PREFIXES)
+    )
+    for obj in objs:
+        _ensure_wd_values(obj, wd_values)
 
 
 def _fix_unused_args(lib: sdf.Document) -> None:
-    arg_ids = {
-        e["@id"] for e in ensure_list(lib["entities"]) + ensure_list(lib["events"])
-    }
-    for event in ensure_list(lib["events"]):
+    events = ensure_list(lib["events"])
+    arg_ids: set[str] = {e["@id"] for e in ensure_list(lib["entities"])}
+    arg_ids.update(e["@id"] for e in events)
+    for event in events:
         event["participants"] = [
             p
             for p in ensure_list(event.get("participants", []))
@@ -497,18 +643,40 @@ def _fix_unused_args(lib: sdf.Document) -> None:
         ]
 
 
+_SQL_SELECT_SCHEMAS = (
+    "SELECT data FROM Schema WHERE atId IN (SELECT value FROM json_each(?))"
+)
+"""Select the schemas whose @id is in a JSON array
+
+Binding the whole array as one parameter keeps the SQL text constant so that
+the compiled statement is reused regardless of how many schemas are selected.
+
+"""
+
+
 def zip_schemas(schema_ids: List[str]) -> io.BytesIO:
-    """Return ZIP archive of the selected schemas."""
-    qmarks = ",".join("?" * len(schema_ids))
-    rows = execute(f"SELECT data FROM Schema where atId IN ({qmarks})", schema_ids)
+    """Return ZIP archive of the selected schemas, positioned at the start.
+
+    Notes
+    -----
+    Quarantined schemas are skipped; all others were validated when written,
+    so they are stored as-is without being decoded.
+
+    """
+    sql_select = (
+        "SELECT json_extract(data, '$.\"@id\"'), data FROM Schema "
+        "WHERE quarantined = 0 AND atId IN (SELECT value FROM json_each(?))"
+    )
+    rows = execute(sql_select, [_json.dumps(schema_ids)])
     data = io.BytesIO()
-    with zipfile.ZipFile(data, "w", compression=zipfile.ZIP_DEFLATED) as z:
-        for row in rows:
-            try:
-                schema = loads_sdf(row[0])
-            except util.ValidationError:
+    with zipfile.ZipFile(
+        data, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+    ) as z:
+        for atId, schema_data in rows:
+            if atId is None:
                 continue
-            z.writestr(schema["@id"].split("/")[-1] + ".json", row[0])
+            z.writestr(atId.split("/")[-1] + ".json", schema_data)
+    data.seek(0)
     return data
 
 
@@ -517,33 +685,33 @@ _alphabet = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 
 def digest_to_base62(b: bytes) -> str:
     """Conver bytes human-readable string."""
-    n = sum(x * 2 ** (8 * i) for i, x in enumerate(b))
-    s = ""
+    n = int.from_bytes(b, "little")
+    digits = []
     while n > 0:
-        s += _alphabet[n % len(_alphabet)]
-        n //= len(_alphabet)
-    return s
+        n, r = divmod(n, 62)
+        digits.append(_alphabet[r])
+    return "".join(digits)
 
 
 def package_schemas(name: str, schema_ids: List[str]) -> sdf.Document:
     """Build a schema library from the specified schemas."""
-    qmarks = ",".join("?" * len(schema_ids))
-    rows = execute(f"SELECT data FROM Schema where atId IN ({qmarks})", schema_ids)
-    schemas = []
+    rows = execute(_SQL_SELECT_SCHEMAS, [_json.dumps(schema_ids)])
+    loaded: list[tuple[str, sdf.Document]] = []
     for row in rows:
         try:
-            schema = loads_sdf(row[0])
+            loaded.append((row[0], loads_sdf(row[0])))
         except util.ValidationError:
             continue
-        schemas.append(schema)
+    loaded.sort(key=lambda x: x[1]["@id"])
+    schemas = [s for _, s in loaded]
     all_event_types = {
         e.get("wd_node", None) for s in schemas for e in ensure_list(s["events"])
     }
 
-    schemas = sorted(schemas, key=lambda x: x["@id"])
+    # Hash the stored JSON as-is rather than re-serializing each schema
     hasher = hashlib.blake2b(digest_size=8, usedforsecurity=False)
-    for s in schemas:
-        hasher.update(json.dumps(s).encode())
+    for raw, _ in loaded:
+        hasher.update(raw.encode())
     digest = digest_to_base62(hasher.digest())
     library = create_blank_schema(f"{name}-{digest}")
     library["privateData"] = {"inputDigest": digest}
@@ -613,51 +781,106 @@ def init_db() -> None:
                 for key, fref in row_type.__annotations__.items()
             )
             cur.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({col_defs})")
+        for index_def in INDEXES:
+            cur.execute(f"CREATE INDEX IF NOT EXISTS {index_def}")
     _validate_schemas()
 
 
+def _check_schema(row: tuple[str, str]) -> tuple[str, str | None]:
+    """Return the @id and quarantine reason (``None`` if valid) of a schema."""
+    atId, data = row
+    try:
+        util.validate_type(sdf.Document, _json.loads(data))
+    except util.ValidationError as e:
+        return atId, "Not Valid SDF\n" + e.args[0]
+    except _json.JSONDecodeError:
+        return atId, "Not valid JSON"
+    return atId, None
+
+
+VALIDATION_MAX_WORKERS = 4
+"""Upper bound on the processes used to validate schemas at startup"""
+VALIDATION_PARALLEL_THRESHOLD = 200
+"""Validate serially if there are fewer schemas than this
+
+Starting worker processes (which must each re-import the code and rebuild the
+Pydantic models) costs more than it saves on small databases.
+
+"""
+
+
+def _iter_schema_checks(
+    rows: Iterator[tuple[str, str]], n_rows: int
+) -> Iterator[tuple[str, str | None]]:
+    """Yield `_check_schema` results, in parallel if there are enough rows."""
+    n_workers = min(VALIDATION_MAX_WORKERS, os.cpu_count() or 1)
+    if n_rows < VALIDATION_PARALLEL_THRESHOLD or n_workers < 2:
+        yield from map(_check_schema, rows)
+        return
+    # Submit a window at a time so that rows are read (and pickled)
+    # incrementally rather than all up front
+    window = n_workers * 64
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        while chunk := list(itertools.islice(rows, window)):
+            yield from executor.map(_check_schema, chunk, chunksize=16)
+
+
 def _validate_schemas() -> None:
     """Validate all schemas in the database.
 
     Notes
     -----
     This function will quarantine any schemas that fail validation.
+    Validation is CPU-bound, so large databases are validated in parallel
+    across processes.  Schemas are read and validated outside of any
+    transaction so that other writers are not blocked in the meantime; only
+    the quarantine updates are written in a transaction.
 
     """
+    n_rows = execute("SELECT COUNT(*) FROM Schema WHERE quarantined=0")[0][0]
+    rows = iter_execute("SELECT atId, data FROM Schema WHERE quarantined=0")
+    failures: list[SchemasTableRow] = [
+        {"atId": atId, "note": reason}
+        for atId, reason in _iter_schema_checks(((r[0], r[1]) for r in rows), n_rows)
+        if reason is not None
+    ]
+    if not failures:
+        return
+    sql_update = (
+        "UPDATE Schema SET quarantined=1, note=:note "
+        "WHERE atId=:atId AND quarantined=0"
+    )
     with do_transaction() as txn:
-        rows = txn.execute("SELECT atId, data FROM Schema WHERE quarantined=0")
-
-        for atId, data in rows:
-            reason: str | None = None
-            try:
-                data_dict = json.loads(data)
-                verified = util.validate_type(sdf.Document, data_dict)
-            except util.ValidationError as e:
-                reason = "Not Valid SDF\n" + e.args[0]
-            except json.decoder.JSONDecodeError:
-                reason = "Not valid JSON"
-            if reason is not None:
-                sql_update = (
-                    "UPDATE Schema SET quarantined=1, note=:note WHERE atId=:atId"
-                )
-                txn.execute(sql_update, {"atId": atId, "note": reason})
+        txn.executemany(sql_update, failures)
 
 
 def _unix_now() -> int:
     """Get current time in Unix epoch format."""
-    return int(datetime.now().timestamp())
+    return int(time.time())
 
 
 def describe_schema(sdf_data: sdf.Document) -> str:
     return f"{sdf_data['@id']}"
 
 
+@functools.cache
+def _read_context_file() -> bytes:
+    """Read the JSON-LD context file, which does not change at runtime.
+
+    Notes
+    -----
+    The raw file is cached rather than the parsed context since each new
+    schema needs its own (mutable) copy, and decoding is cheaper than a deep
+    copy.
+
+    """
+    context_path = get_config()["sdf_config_path"] / get_config()["context_file"]
+    return context_path.read_bytes()
+
+
 def create_blank_schema(name: str) -> sdf.Document:
     """Create and save a new schema with a given name."""
-    with (get_config()["sdf_config_path"] / get_config()["context_file"]).open(
-        "r"
-    ) as fo:
-        jsonldContext = json.load(fo)
+    jsonldContext = _json.loads(_read_context_file())
 
     return {
         "@context": jsonldContext["@context"],
@@ -672,16 +895,27 @@ def create_blank_schema(name: str) -> sdf.Document:
     }
 
 
-def get_event_primitives() -> dict[str, dict[str, Any]]:
-    """Generate and return event primitives from ontology file."""
-    with gzip.open(get_config()["sdf_config_path"] / "xpo.event.json.gz") as fo:
-        xpo_dict = json.load(fo)
-    with (get_config()["sdf_config_path"] / "faers.event.json").open("r") as fo:
-        faers_dict = json.load(fo)
-    all_values = itertools.chain(
-        *[d["events"].values() for d in [xpo_dict, faers_dict]]
-    )
-    primitive_dict = {
+ONTOLOGY_FILES = ("xpo.event.json.gz", "faers.event.json")
+"""Event ontology files in the SDF config directory (optionally gzipped)"""
+
+
+@functools.lru_cache(maxsize=1)
+def _load_ontology_primitives(
+    files: tuple[tuple[Path, int], ...]
+) -> dict[str, dict[str, Any]]:
+    """Build the primitive dicts from the ontology files.
+
+    ``files`` is a tuple of ``(path, mtime)`` pairs so that the cached result
+    is discarded if any of the files change.
+
+    """
+    all_values = []
+    for path, _ in files:
+        data = path.read_bytes()
+        if path.suffix == ".gz":
+            data = gzip.decompress(data)
+        all_values.extend(_json.loads(data)["events"].values())
+    return {
         v["wd_node"]: {
             "wd_node": v["wd_node"],
             "wd_label": v["name"],
@@ -697,9 +931,23 @@ def get_event_primitives() -> dict[str, dict[str, Any]]:
         if "wd_node" in v
     }
 
-    with do_transaction() as txn:
-        rows = txn.execute("SELECT atId, json_extract(data, '$.entities') FROM Schema")
-    parsed_rows = [(row[0], json.loads(row[1])) for row in rows if row[1]]
+
+def get_event_primitives() -> dict[str, dict[str, Any]]:
+    """Generate and return event primitives from ontology file.
+
+    Notes
+    -----
+    The primitives from the ontology are cached and shared between calls, so
+    the returned value must not be modified.
+
+    """
+    paths = [get_config()["sdf_config_path"] / f for f in ONTOLOGY_FILES]
+    primitive_dict = _load_ontology_primitives(
+        tuple((p, p.stat().st_mtime_ns) for p in paths)
+    )
+
+    rows = iter_execute("SELECT atId, json_extract(data, '$.entities') FROM Schema")
+    parsed_rows = [(row[0], _json.loads(row[1])) for row in rows if row[1]]
     subschema_dict = {
         row[0]: {
             "wd_node": row[0],
@@ -719,6 +967,16 @@ def get_event_primitives() -> dict[str, dict[str, Any]]:
     return cast(dict[str, dict[str, Any]], subschema_dict | primitive_dict)
 
 
+def _parse_wikidata_entity(entity: dict[str, Any]) -> Tuple[str, str]:
+    """Extract the label and description from a Wikidata API entity."""
+    label = entity["labels"]["en"]["value"]
+    if entity["descriptions"]:
+        desc = entity["descriptions"]["en"]["value"]
+    else:
+        desc = label
+    return label, desc
+
+
 def get_wikidata_values(wd_node: str) -> Tuple[str, str]:
     """Get Wikidata metadata for QNode
 
@@ -735,39 +993,93 @@ def get_wikidata_values(wd_node: str) -> Tuple[str, str]:
         desc = rows[0][1]
     else:
         result = util.get_wikidata_item(wd_node)
-        data = json.loads(result.text)
+        data = _json.loads(result.content)
         if "error" in data:
             return "", ""
-        data = data["entities"][wd_node]
-        label = data["labels"]["en"]["value"]
-        if data["descriptions"]:
-            desc = data["descriptions"]["en"]["value"]
-        else:
-            desc = label
+        label, desc = _parse_wikidata_entity(data["entities"][wd_node])
         with do_transaction() as txn:
-            txn.execute("insert into wd_node values (?,?,?)", (wd_node, label, desc))
+            txn.execute(
+                "insert or ignore into wd_node values (?,?,?)", (wd_node, label, desc)
+            )
     return label, desc
 
 
+def _fetch_wikidata_batch(wd_nodes: list[str]) -> dict[str, Tuple[str, str]]:
+    """Fetch metadata for a batch of QNodes from the Wikidata API.
+
+    QNodes missing from the result (e.g., if the API rejected the batch) are
+    omitted.
+
+    """
+    response = util.get_wikidata_items(wd_nodes, timeout=util.WIKIDATA_BATCH_TIMEOUT)
+    data = _json.loads(response.content)
+    if "error" in data:
+        return {}
+    entities = data["entities"]
+    return {n: _parse_wikidata_entity(entities[n]) for n in wd_nodes if n in entities}
+
+
+def get_wikidata_values_many(wd_nodes: Iterable[str]) -> dict[str, Tuple[str, str]]:
+    """Get Wikidata metadata for several QNodes at once
+
+    Cached QNodes are read with a single query. The remainder are requested
+    from the Wikidata API in concurrent batches and cached; any QNodes which
+    could not be fetched in a batch are retried with `get_wikidata_values`.
+
+    Returns
+    -------
+    dict[str, Tuple[str, str]]
+        Map from each QNode to its label and description
+
+    """
+    nodes = list(dict.fromkeys(wd_nodes))
+    rows = execute(
+        "select node, label, description from wd_node "
+        "where node in (select value from json_each(?))",
+        [_json.dumps(nodes)],
+    )
+    values = {node: (label, desc) for node, label, desc in rows}
+    misses = [node for node in nodes if node not in values]
+    if not misses:
+        return values
+
+    size = util.WIKIDATA_BATCH_SIZE
+    batches = [misses[i : i + size] for i in range(0, len(misses), size)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        fetched: dict[str, Tuple[str, str]] = {}
+        for result in executor.map(_fetch_wikidata_batch, batches):
+            fetched.update(result)
+    with do_transaction() as txn:
+        txn.executemany(
+            "insert or ignore into wd_node values (?,?,?)",
+            [(node, label, desc) for node, (label, desc) in fetched.items()],
+        )
+    values |= fetched
+    for node in misses:
+        if node not in values:
+            values[node] = get_wikidata_values(node)
+    return values
+
+
 def dump_sdf(
     obj: sdf.Document, fp: IO[str], *, indent: int | None = DEFAULT_JSON_INDENT
 ) -> None:
     """Type-safe json dump."""
-    json.dump(obj, fp, indent=indent)
+    fp.write(_json.dumps(obj, indent=indent))
 
 
 def dumps_sdf(obj: sdf.Document, *, indent: int | None = DEFAULT_JSON_INDENT) -> str:
     """Type-safe json dumps."""
-    return json.dumps(obj, indent=indent)
+    return _json.dumps(obj, indent=indent)
 
 
 # IO[str | bytes] might be too restrictive. `load` uses SupportsRead, but that
 # is not easily imported
 def load_sdf(fp: IO[str]) -> sdf.Document:
     """Type-safe json load."""
-    return util.validate_type(sdf.Document, json.load(fp))
+    return util.validate_type(sdf.Document, _json.loads(fp.read()))
 
 
 def loads_sdf(s: str | bytes) -> sdf.Document:
     """Type-safe json loads."""
-    return util.validate_type(sdf.Document, json.loads(s))
+    return util.validate_type(sdf.Document, _json.loads(s))
@@ -17,6 +17,7 @@ def main() -> None:
         qnode_idx = header.index(qnode_title)
         argument_idx = header.index(argument_title)
         items: dict[str, Any] = {}
+        qnodes: dict[str, str] = {}
         for row in reader:
             qlabel_node = row[qnode_idx].split("\n")[0].strip()
             if "?" in qlabel_node:
@@ -30,7 +31,7 @@ def main() -> None:
             items[key] = {
                 "name": qlabel,
                 "wd_qnode": qnode,
-                "wd_description": db.get_wikidata_values(qnode)[1],
+                "wd_description": None,
                 "type": "event_type",
                 "curated_by": "Sue Holm",
                 "arguments": [
@@ -42,6 +43,10 @@ def main() -> None:
                     for arg in args
                 ],
             }
+            qnodes[key] = qnode
+    wd_values = db.get_wikidata_values_many(qnodes.values())
+    for key, qnode in qnodes.items():
+        items[key]["wd_description"] = wd_values[qnode][1]
     json.dump({"events": items}, sys.stdout, indent=2)
 
 
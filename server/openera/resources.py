@@ -6,8 +6,7 @@ belongs in other files.
 """
 from __future__ import annotations
 
-import json
-from typing import Any, cast
+from typing import Any, Iterator, cast
 import uuid
 import datetime
 
@@ -15,6 +14,7 @@ import requests
 import falcon
 import typing_extensions
 
+from . import _json
 from . import util
 from .config import get_config
 from . import sdf
@@ -27,21 +27,7 @@ class Schemas:
     @staticmethod
     def on_get(req: Any, resp: Any) -> None:
         """Get a list of schema summaries."""
-        body = []
-        sql_select = """
-            SELECT json_extract(
-                data,
-                '$.@id',
-                '$.privateData.eratosthenesTags'
-            )
-            FROM Schema
-            WHERE quarantined=0
-        """
-        rows = db.execute(sql_select)
-        for row in rows:
-            schemaId, tags = json.loads(row[0])
-            body.append({"schemaId": schemaId, "tags": tags or []})
-        resp.body = json.dumps(body)
+        resp.data = db.get_schema_summaries()
         resp.status = falcon.HTTP_200
 
     @staticmethod
@@ -59,13 +45,13 @@ class Schemas:
             If body parameters are missing
 
         """
-        req_json = json.load(req.stream)
+        req_json = util.read_json(req)
         if "name" not in req_json:
             raise falcon.HTTPBadRequest('Missing param "name"')
         sdf_data = db.create_blank_schema(str(req_json["name"]))
         with db.do_transaction() as txn:
             txn.write_new_schema(sdf_data)
-        resp.body = json.dumps({"schemaId": sdf_data["@id"]})
+        resp.data = _json.dumpb({"schemaId": sdf_data["@id"]})
         resp.status = falcon.HTTP_201
 
 
@@ -102,7 +88,7 @@ class SchemaInstance:
                 "Please refresh the browser page to update to the newest version of OpenEra.",
             )
         sdf_json = db.get_schema(schema_id, no_validate=True)
-        resp.body = db.dumps_sdf(sdf_json)
+        resp.data = _json.dumpb(sdf_json)
         resp.downloadable_as = sdf_json["@id"].split("/")[-1] + ".json"
         resp.status = falcon.HTTP_200
 
@@ -128,7 +114,7 @@ class SchemaInstance:
 
         """
         if req.content_length:
-            req_json = json.load(req.stream)
+            req_json = util.read_json(req)
         else:
             req_json = {}
         if (client_id := req_json.get("clientId", None)) is None:
@@ -165,7 +151,7 @@ class SchemaInstance:
         """
         should_overwrite = req.get_param_as_bool("overwrite")
         if req.content_length:
-            req_json = json.load(req.stream)
+            req_json = util.read_json(req)
         else:
             req_json = {}
         if not all(k in req_json for k in ("sdf", "clientId")):
@@ -178,18 +164,14 @@ class SchemaInstance:
         except util.ValidationError as e:
             title = "Invalid SDF Document"
             raise falcon.HTTPBadRequest(title, e.args[0])
-        already_exists = True
-        try:
-            db.get_schema(schema_id)
-        except falcon.HTTPNotFound:
-            already_exists = False
+        already_exists = db.schema_exists(schema_id)
         if already_exists and not should_overwrite:
             desc = (
                 "The schema already exists, and the overwrite flag was not set "
                 f"for schema {db.describe_schema(document)}."
             )
             raise falcon.HTTPConflict("Schema already exists", desc)
-        util.replace_kairos_prefix(sdf)
+        util.replace_kairos_prefix(document)
         with db.do_transaction() as txn:
             if already_exists:
                 txn.write_schema(schema_id, document, client_id)
@@ -233,10 +215,19 @@ class SchemaInstanceCopy:
         )
         with db.do_transaction() as txn:
             txn.write_new_schema(sdf_data)
-        resp.body = json.dumps({"schemaId": sdf_data["@id"]})
+        resp.data = _json.dumpb({"schemaId": sdf_data["@id"]})
         resp.status = falcon.HTTP_201
 
 
+_QUARANTINE_ROW = """
+                <tr>
+                    <td>{}</td>
+                    <td><a href=/api/schemas/{}>{}</a></td>
+                    <td>{}</td>
+                </tr>
+"""
+
+
 class QuarantineSummary:
     """Generate an HTML table summarizing the quarantine directory."""
 
@@ -251,22 +242,11 @@ class QuarantineSummary:
 
         """
 
-        def make_row(atId: str, note: str) -> str:
-            escaped_id = atId.replace("/", "_FSLASH_")
-            url = f"/api/schemas/{escaped_id}"
-            last_modfied = datetime.datetime.fromtimestamp(0)
-            return f"""
-                <tr>
-                    <td>{last_modfied}</td>
-                    <td><a href={url}>{atId}</a></td>
-                    <td>{note}</td>
-                </tr>
-            """
-
-        rows = db.execute("SELECT atId, note FROM Schema WHERE quarantined=1")
+        last_modified = datetime.datetime.fromtimestamp(0)
+        rows = db.iter_execute("SELECT atId, note FROM Schema WHERE quarantined=1")
 
-        resp.content_type = falcon.MEDIA_HTML
-        resp.body = f"""
+        def generate_html() -> Iterator[bytes]:
+            yield b"""
             <h1>Quarantined Files</h1>
             <table>
                 <tr>
@@ -274,9 +254,15 @@ class QuarantineSummary:
                     <th>File Name</th>
                     <th>Quarantine Reason</th>
                 </tr>
-                {"".join(make_row(*row) for row in rows)}
-            </table>
-        """
+            """
+            for atId, note in rows:
+                escaped_id = atId.replace("/", "_FSLASH_")
+                row = _QUARANTINE_ROW.format(last_modified, escaped_id, atId, note)
+                yield row.encode()
+            yield b"</table>\n"
+
+        resp.content_type = falcon.MEDIA_HTML
+        resp.stream = generate_html()
 
 
 class SchemaTags:
@@ -301,7 +287,7 @@ class SchemaTags:
 
         """
         sdf_data = db.get_schema(schema_id)
-        req_body = json.load(req.stream)
+        req_body = util.read_json(req)
         if not ("tags" in req_body and "clientId" in req_body):
             desc = 'Request must include "tags" and "clientId" in the body.'
             raise falcon.HTTPBadGateway("Missing parameters", desc)
@@ -365,7 +351,7 @@ class Events:
 
         """
         body = db.get_event_primitives()
-        resp.body = json.dumps(body)
+        resp.data = _json.dumpb(body)
         resp.status = falcon.HTTP_200
 
 
@@ -396,7 +382,65 @@ class Wikidata:
         except requests.exceptions.ConnectionError as e:
             msg = "Could not connect to WikiData"
             raise falcon.HTTPServiceUnavailable(title=msg, description=msg) from e
-        resp.body = json.dumps({"label": result[0], "description": result[1]})
+        resp.data = _json.dumpb({"label": result[0], "description": result[1]})
+
+
+WIKIDATA_BATCH_MAX_IDS = 100
+"""Maximum number of QNodes accepted by one `WikidataBatch` request
+
+Every QNode which a batch fails to resolve is retried individually, so this
+bounds how long a single request can occupy a worker.
+
+"""
+
+
+class WikidataBatch:
+    """Resource for bulk Wikidata queries."""
+
+    def on_post(self, req: Any, resp: Any) -> None:
+        """Get summaries of several Wikidata items at once.
+
+        Parameters
+        ----------
+        ids : list[str], in JSON body
+            QNodes for Wikidata items
+
+        Returns
+        -------
+        None
+            Response body: JSON object mapping each QNode to its data
+
+        Raises
+        ------
+        falcon.HTTPBadRequest
+            If body parameters are missing or malformed
+        falcon.HTTPServiceUnavailable
+            If unable to connect to Wikidata server
+
+        """
+        req_json = util.read_json(req)
+        if not isinstance(req_json, dict) or "ids" not in req_json:
+            raise falcon.HTTPBadRequest('Missing param "ids"')
+        ids = req_json["ids"]
+        if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+            raise falcon.HTTPBadRequest('Param "ids" must be a list of strings')
+        if len(ids) > WIKIDATA_BATCH_MAX_IDS:
+            msg = f'Param "ids" may have at most {WIKIDATA_BATCH_MAX_IDS} items'
+            raise falcon.HTTPBadRequest(msg)
+        try:
+            results = db.get_wikidata_values_many(ids)
+        except (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+        ) as e:
+            msg = "Could not connect to WikiData"
+            raise falcon.HTTPServiceUnavailable(title=msg, description=msg) from e
+        resp.data = _json.dumpb(
+            {
+                node: {"label": label, "description": desc}
+                for node, (label, desc) in results.items()
+            }
+        )
 
 
 class PackageSchemas:
@@ -418,9 +462,9 @@ class PackageSchemas:
             Response body: JSON, SDF schema library
 
         """
-        req_json = json.load(req.stream)
+        req_json = util.read_json(req)
         try:
-            resp.body = json.dumps(
+            resp.data = _json.dumpb(
                 db.package_schemas(req_json["name"], req_json["schemaIds"])
             )
         except Exception as e:
@@ -449,6 +493,7 @@ class ZipSchemas:
             Response body: binary (ZIP), ZIPped schemas
 
         """
-        req_json = json.load(req.stream)
+        req_json = util.read_json(req)
         resp.content_type = "application/zip"
-        resp.body = db.zip_schemas(req_json["schemaIds"]).getvalue()
+        data = db.zip_schemas(req_json["schemaIds"])
+        resp.set_stream(data, data.getbuffer().nbytes)
@@ -3,44 +3,42 @@
 
 from typing import NewType, Literal, Union, TypedDict, Any
 
-_GenericSdfPropertiesTotal = TypedDict("_GenericSdfPropertiesTotal", {}, total=True)
-_GenericSdfPropertiesOptional = TypedDict(
-    "_GenericSdfPropertiesOptional",
-    {"privateData": "dict[str, Any]", "comment": "Union[str, list[str]]"},
-    total=False,
-)
+
+class _GenericSdfPropertiesTotal(TypedDict, total=True):
+    pass
+
+
+class _GenericSdfPropertiesOptional(TypedDict, total=False):
+    privateData: "dict[str, Any]"
+    comment: "Union[str, list[str]]"
 
 
 class GenericSdfProperties(_GenericSdfPropertiesTotal, _GenericSdfPropertiesOptional):
     pass
 
 
-_HasWdNodeTotal = TypedDict(
-    "_HasWdNodeTotal",
-    {
-        "wd_node": "Union[WdNode, list[WdNode]]",
-        "wd_label": "Union[str, list[str]]",
-        "wd_description": "Union[str, list[str]]",
-    },
-    total=True,
-)
-_HasWdNodeOptional = TypedDict("_HasWdNodeOptional", {}, total=False)
+class _HasWdNodeTotal(TypedDict, total=True):
+    wd_node: "Union[WdNode, list[WdNode]]"
+    wd_label: "Union[str, list[str]]"
+    wd_description: "Union[str, list[str]]"
+
+
+class _HasWdNodeOptional(TypedDict, total=False):
+    pass
 
 
 class HasWdNode(_HasWdNodeTotal, _HasWdNodeOptional):
     pass
 
 
-_HasWdNodeOptionalTotal = TypedDict("_HasWdNodeOptionalTotal", {}, total=True)
-_HasWdNodeOptionalOptional = TypedDict(
-    "_HasWdNodeOptionalOptional",
-    {
-        "wd_node": "Union[WdNode, list[WdNode]]",
-        "wd_label": "Union[str, list[str]]",
-        "wd_description": "Union[str, list[str]]",
-    },
-    total=False,
-)
+class _HasWdNodeOptionalTotal(TypedDict, total=True):
+    pass
+
+
+class _HasWdNodeOptionalOptional(TypedDict, total=False):
+    wd_node: "Union[WdNode, list[WdNode]]"
+    wd_label: "Union[str, list[str]]"
+    wd_description: "Union[str, list[str]]"
 
 
 class HasWdNodeOptional(_HasWdNodeOptionalTotal, _HasWdNodeOptionalOptional):
@@ -105,20 +103,17 @@ _DocumentTotal = TypedDict(
     },
     total=True,
 )
-_DocumentOptional = TypedDict(
-    "_DocumentOptional",
-    {
-        "events": "Union[Event, list[Event]]",
-        "ceID": "str",
-        "entities": "Union[Entity, list[Entity]]",
-        "instances": "Union[Instance, list[Instance]]",
-        "provenanceData": "Union[ProvenanceDatum, list[ProvenanceDatum]]",
-        "relations": "Union[Relation, list[Relation]]",
-        "ta2": "bool",
-        "task2": "bool",
-    },
-    total=False,
-)
+
+
+class _DocumentOptional(TypedDict, total=False):
+    events: "Union[Event, list[Event]]"
+    ceID: "str"
+    entities: "Union[Entity, list[Entity]]"
+    instances: "Union[Instance, list[Instance]]"
+    provenanceData: "Union[ProvenanceDatum, list[ProvenanceDatum]]"
+    relations: "Union[Relation, list[Relation]]"
+    ta2: "bool"
+    task2: "bool"
 
 
 class Document(GenericSdfProperties, _DocumentTotal, _DocumentOptional):
@@ -135,17 +130,14 @@ _InstanceTotal = TypedDict(
     },
     total=True,
 )
-_InstanceOptional = TypedDict(
-    "_InstanceOptional",
-    {
-        "confidence": "float",
-        "description": "str",
-        "relations": "Union[Relation, list[Relation]]",
-        "schemaInstantiations": "Union[str, list[str]]",
-        "ta1ref": 'Union["EventId", "InstanceId", "RelationId"]',
-    },
-    total=False,
-)
+
+
+class _InstanceOptional(TypedDict, total=False):
+    confidence: "float"
+    description: "str"
+    relations: "Union[Relation, list[Relation]]"
+    schemaInstantiations: "Union[str, list[str]]"
+    ta1ref: 'Union["EventId", "InstanceId", "RelationId"]'
 
 
 class Instance(_InstanceTotal, _InstanceOptional):
@@ -165,11 +157,11 @@ _ValueTotal = TypedDict(
     },
     total=True,
 )
-_ValueOptional = TypedDict(
-    "_ValueOptional",
-    {"confidence": "Union[float, list[float]]", "modality": "Modality"},
-    total=False,
-)
+
+
+class _ValueOptional(TypedDict, total=False):
+    confidence: "Union[float, list[float]]"
+    modality: "Modality"
 
 
 class Value(_ValueTotal, _ValueOptional):
@@ -177,20 +169,17 @@ class Value(_ValueTotal, _ValueOptional):
 
 
 _EntityTotal = TypedDict("_EntityTotal", {"@id": "EntityId", "name": "str"}, total=True)
-_EntityOptional = TypedDict(
-    "_EntityOptional",
-    {
-        "aka": "Union[str, list[str]]",
-        "centrality": "float",
-        "reference": "Union[str, list[str]]",
-        "ta2wd_node": "Union[WdNode, list[WdNode]]",
-        "ta2wd_label": "Union[str, list[str]]",
-        "ta2wd_description": "Union[str, list[str]]",
-        "origName": "str",
-        "confidence": "Union[float, list[float]]",
-    },
-    total=False,
-)
+
+
+class _EntityOptional(TypedDict, total=False):
+    aka: "Union[str, list[str]]"
+    centrality: "float"
+    reference: "Union[str, list[str]]"
+    ta2wd_node: "Union[WdNode, list[WdNode]]"
+    ta2wd_label: "Union[str, list[str]]"
+    ta2wd_description: "Union[str, list[str]]"
+    origName: "str"
+    confidence: "Union[float, list[float]]"
 
 
 class Entity(GenericSdfProperties, HasWdNodeOptional, _EntityTotal, _EntityOptional):
@@ -202,19 +191,16 @@ ModalityValue = Literal["generic", "hedged", "irrealis", "negated"]
 Modality = Union[ModalityValue, list[ModalityValue]]
 Aspect = Literal["stat", "punct", "perf", "imperf", "iter", "incept", "unspec"]
 
-_ProvenanceDatumGenericTotal = TypedDict(
-    "_ProvenanceDatumGenericTotal",
-    {
-        "provenanceID": "ProvenanceDatumId",
-        "childID": "str",
-        "mediaType": "str",
-        "parentIDs": "Union[str, list[str]]",
-    },
-    total=True,
-)
-_ProvenanceDatumGenericOptional = TypedDict(
-    "_ProvenanceDatumGenericOptional", {"sourceURL": "str"}, total=False
-)
+
+class _ProvenanceDatumGenericTotal(TypedDict, total=True):
+    provenanceID: "ProvenanceDatumId"
+    childID: "str"
+    mediaType: "str"
+    parentIDs: "Union[str, list[str]]"
+
+
+class _ProvenanceDatumGenericOptional(TypedDict, total=False):
+    sourceURL: "str"
 
 
 class ProvenanceDatumGeneric(
@@ -230,12 +216,14 @@ ProvenanceDatum = Union[
     "ProvenanceDatumImage",
 ]
 
-_ProvenanceDatumTextTotal = TypedDict(
-    "_ProvenanceDatumTextTotal", {"length": "float", "offset": "float"}, total=True
-)
-_ProvenanceDatumTextOptional = TypedDict(
-    "_ProvenanceDatumTextOptional", {}, total=False
-)
+
+class _ProvenanceDatumTextTotal(TypedDict, total=True):
+    length: "float"
+    offset: "float"
+
+
+class _ProvenanceDatumTextOptional(TypedDict, total=False):
+    pass
 
 
 class ProvenanceDatumText(
@@ -244,17 +232,15 @@ class ProvenanceDatumText(
     pass
 
 
-_ProvenanceDatumVideoTotal = TypedDict("_ProvenanceDatumVideoTotal", {}, total=True)
-_ProvenanceDatumVideoOptional = TypedDict(
-    "_ProvenanceDatumVideoOptional",
-    {
-        "boundingBox": "Union[float, list[float]]",
-        "endTime": "float",
-        "keyframes": "Union[float, list[float]]",
-        "startTime": "float",
-    },
-    total=False,
-)
+class _ProvenanceDatumVideoTotal(TypedDict, total=True):
+    pass
+
+
+class _ProvenanceDatumVideoOptional(TypedDict, total=False):
+    boundingBox: "Union[float, list[float]]"
+    endTime: "float"
+    keyframes: "Union[float, list[float]]"
+    startTime: "float"
 
 
 class ProvenanceDatumVideo(
@@ -263,12 +249,13 @@ class ProvenanceDatumVideo(
     pass
 
 
-_ProvenanceDatumAudioTotal = TypedDict(
-    "_ProvenanceDatumAudioTotal", {"endTime": "float", "startTime": "float"}, total=True
-)
-_ProvenanceDatumAudioOptional = TypedDict(
-    "_ProvenanceDatumAudioOptional", {}, total=False
-)
+class _ProvenanceDatumAudioTotal(TypedDict, total=True):
+    endTime: "float"
+    startTime: "float"
+
+
+class _ProvenanceDatumAudioOptional(TypedDict, total=False):
+    pass
 
 
 class ProvenanceDatumAudio(
@@ -277,14 +264,12 @@ class ProvenanceDatumAudio(
     pass
 
 
-_ProvenanceDatumImageTotal = TypedDict(
-    "_ProvenanceDatumImageTotal",
-    {"boundingBox": "Union[float, list[float]]"},
-    total=True,
-)
-_ProvenanceDatumImageOptional = TypedDict(
-    "_ProvenanceDatumImageOptional", {}, total=False
-)
+class _ProvenanceDatumImageTotal(TypedDict, total=True):
+    boundingBox: "Union[float, list[float]]"
+
+
+class _ProvenanceDatumImageOptional(TypedDict, total=False):
+    pass
 
 
 class ProvenanceDatumImage(
@@ -302,22 +287,19 @@ _RelationTotal = TypedDict(
     },
     total=True,
 )
-_RelationOptional = TypedDict(
-    "_RelationOptional",
-    {
-        "ta1ref": "EventEntityRelationId",
-        "centrality": "float",
-        "confidence": "float",
-        "modality": "Modality",
-        "name": "str",
-        "reference": "Union[str, list[str]]",
-        "relationObject_prov": "str",
-        "relationProvenance": "Union[str, list[str]]",
-        "relationSubject_prov": "str",
-        "origName": "str",
-    },
-    total=False,
-)
+
+
+class _RelationOptional(TypedDict, total=False):
+    ta1ref: "EventEntityRelationId"
+    centrality: "float"
+    confidence: "float"
+    modality: "Modality"
+    name: "str"
+    reference: "Union[str, list[str]]"
+    relationObject_prov: "str"
+    relationProvenance: "Union[str, list[str]]"
+    relationSubject_prov: "str"
+    origName: "str"
 
 
 class Relation(GenericSdfProperties, HasWdNode, _RelationTotal, _RelationOptional):
@@ -327,54 +309,53 @@ class Relation(GenericSdfProperties, HasWdNode, _RelationTotal, _RelationOptiona
 ChildrenGate = Literal["and", "or", "xor"]
 
 _EventTotal = TypedDict("_EventTotal", {"@id": "EventId", "name": "str"}, total=True)
-_EventOptional = TypedDict(
-    "_EventOptional",
-    {
-        "achieves": "str",
-        "requires": "str",
-        "aka": "Union[str, list[str]]",
-        "children": "Union[Child, list[Child]]",
-        "confidence": "Union[float, list[float]]",
-        "description": "str",
-        "goal": "str",
-        "instanceOf": "EventId",
-        "maxDuration": "str",
-        "minDuration": "str",
-        "modality": "Modality",
-        "children_gate": "ChildrenGate",
-        "participants": "Union[Participant, list[Participant]]",
-        "provenance": "Union[ProvenanceDatumId, list[ProvenanceDatumId]]",
-        "reference": "Union[str, list[str]]",
-        "relations": "Union[Relation, list[Relation]]",
-        "repeatable": "bool",
-        "ta1explanation": "Union[str, list[str]]",
-        "ta1ref": 'Union["EventId", "InstanceId", "RelationId"]',
-        "temporal": "Union[TemporalObject, list[TemporalObject]]",
-        "ta2wd_node": "Union[WdNode, list[WdNode]]",
-        "ta2wd_label": "Union[str, list[str]]",
-        "ta2wd_description": "Union[str, list[str]]",
-        "predictionProvenance": "Union[EventEntityRelationId, list[EventEntityRelationId]]",
-        "isTopLevel": "bool",
-        "origDescription": "str",
-        "origName": "str",
-        "parent": "EventId",
-        "subgroup_events": "Union[EventId, list[EventId]]",
-        "outlinks": "Union[EventId, list[EventId]]",
-    },
-    total=False,
-)
+
+
+class _EventOptional(TypedDict, total=False):
+    achieves: "str"
+    requires: "str"
+    aka: "Union[str, list[str]]"
+    children: "Union[Child, list[Child]]"
+    confidence: "Union[float, list[float]]"
+    description: "str"
+    goal: "str"
+    instanceOf: "EventId"
+    maxDuration: "str"
+    minDuration: "str"
+    modality: "Modality"
+    children_gate: "ChildrenGate"
+    participants: "Union[Participant, list[Participant]]"
+    provenance: "Union[ProvenanceDatumId, list[ProvenanceDatumId]]"
+    reference: "Union[str, list[str]]"
+    relations: "Union[Relation, list[Relation]]"
+    repeatable: "bool"
+    ta1explanation: "Union[str, list[str]]"
+    ta1ref: 'Union["EventId", "InstanceId", "RelationId"]'
+    temporal: "Union[TemporalObject, list[TemporalObject]]"
+    ta2wd_node: "Union[WdNode, list[WdNode]]"
+    ta2wd_label: "Union[str, list[str]]"
+    ta2wd_description: "Union[str, list[str]]"
+    predictionProvenance: "Union[EventEntityRelationId, list[EventEntityRelationId]]"
+    isTopLevel: "bool"
+    origDescription: "str"
+    origName: "str"
+    parent: "EventId"
+    subgroup_events: "Union[EventId, list[EventId]]"
+    outlinks: "Union[EventId, list[EventId]]"
 
 
 class Event(GenericSdfProperties, HasWdNodeOptional, _EventTotal, _EventOptional):
     pass
 
 
-_ChildTotal = TypedDict("_ChildTotal", {"child": "EventId"}, total=True)
-_ChildOptional = TypedDict(
-    "_ChildOptional",
-    {"importance": "float", "optional": "bool", "repeatable": "bool"},
-    total=False,
-)
+class _ChildTotal(TypedDict, total=True):
+    child: "EventId"
+
+
+class _ChildOptional(TypedDict, total=False):
+    importance: "float"
+    optional: "bool"
+    repeatable: "bool"
 
 
 class Child(GenericSdfProperties, _ChildTotal, _ChildOptional):
@@ -386,11 +367,11 @@ _ParticipantTotal = TypedDict(
     {"@id": "ParticipantId", "entity": "EventEntityId", "roleName": "str"},
     total=True,
 )
-_ParticipantOptional = TypedDict(
-    "_ParticipantOptional",
-    {"reference": "Union[str, list[str]]", "values": "Union[Value, list[Value]]"},
-    total=False,
-)
+
+
+class _ParticipantOptional(TypedDict, total=False):
+    reference: "Union[str, list[str]]"
+    values: "Union[Value, list[Value]]"
 
 
 class Participant(
@@ -399,21 +380,19 @@ class Participant(
     pass
 
 
-_TemporalObjectTotal = TypedDict("_TemporalObjectTotal", {}, total=True)
-_TemporalObjectOptional = TypedDict(
-    "_TemporalObjectOptional",
-    {
-        "absoluteTime": "str",
-        "confidence": "float",
-        "duration": "str",
-        "earliestEndTime": "str",
-        "earliestStartTime": "str",
-        "latestStartTime": "str",
-        "latestEndTime": "str",
-        "provenance": "Union[ProvenanceDatumId, list[ProvenanceDatumId]]",
-    },
-    total=False,
-)
+class _TemporalObjectTotal(TypedDict, total=True):
+    pass
+
+
+class _TemporalObjectOptional(TypedDict, total=False):
+    absoluteTime: "str"
+    confidence: "float"
+    duration: "str"
+    earliestEndTime: "str"
+    earliestStartTime: "str"
+    latestStartTime: "str"
+    latestEndTime: "str"
+    provenance: "Union[ProvenanceDatumId, list[ProvenanceDatumId]]"
 
 
 class TemporalObject(
@@ -422,28 +401,29 @@ class TemporalObject(
     pass
 
 
-_EventPrimitiveTotal = TypedDict(
-    "_EventPrimitiveTotal",
-    {
-        "wd_node": "WdNode",
-        "wd_label": "str",
-        "wd_description": "str",
-        "args": "Union[EventArgument, list[EventArgument]]",
-        "isSubschema": "bool",
-    },
-    total=True,
-)
-_EventPrimitiveOptional = TypedDict("_EventPrimitiveOptional", {}, total=False)
+class _EventPrimitiveTotal(TypedDict, total=True):
+    wd_node: "WdNode"
+    wd_label: "str"
+    wd_description: "str"
+    args: "Union[EventArgument, list[EventArgument]]"
+    isSubschema: "bool"
+
+
+class _EventPrimitiveOptional(TypedDict, total=False):
+    pass
 
 
 class EventPrimitive(_EventPrimitiveTotal, _EventPrimitiveOptional):
     pass
 
 
-_EventArgumentTotal = TypedDict(
-    "_EventArgumentTotal", {"name": "str", "fullName": "str"}, total=True
-)
-_EventArgumentOptional = TypedDict("_EventArgumentOptional", {}, total=False)
+class _EventArgumentTotal(TypedDict, total=True):
+    name: "str"
+    fullName: "str"
+
+
+class _EventArgumentOptional(TypedDict, total=False):
+    pass
 
 
 class EventArgument(_EventArgumentTotal, _EventArgumentOptional):
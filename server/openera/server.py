@@ -20,6 +20,7 @@ api_dict = {
     },
     "package": resources.PackageSchemas(),
     "zip": resources.ZipSchemas(),
+    "wikidata": resources.WikidataBatch(),
     "wikidata/{item_id}": resources.Wikidata(),
     "quarantine": resources.QuarantineSummary(),
 }
@@ -17,10 +17,9 @@ from typing import (
     Union,
     cast,
 )
-from collections.abc import Iterator, MutableMapping
+from collections.abc import Iterable, MutableMapping
 from pathlib import Path
 import base64
-import json
 import re
 import uuid
 import functools
@@ -30,6 +29,7 @@ import requests
 import falcon
 import pydantic
 
+from . import _json
 from . import sdf
 from . import util
 from .config import get_config
@@ -105,6 +105,24 @@ class UriConverter(falcon.routing.converters.BaseConverter):  # type: ignore
         return value.replace("_FSLASH_", "/")
 
 
+def read_json(req: Any) -> Any:
+    """Read and decode a request's JSON body.
+
+    ``req.bounded_stream`` is read in one call so that the body is only
+    buffered once, and never read past ``Content-Length``.
+
+    Raises
+    ------
+    falcon.HTTPBadRequest
+        If the body is not valid JSON
+
+    """
+    try:
+        return _json.loads(req.bounded_stream.read())
+    except _json.JSONDecodeError as e:
+        raise falcon.HTTPBadRequest("Invalid JSON", str(e)) from e
+
+
 def create_api(app: Any, base_route: str, api_dict: dict[str, Any]) -> None:
     """Register resources given by a dictionary on the server instance.
 
@@ -140,17 +158,16 @@ session.mount("https://", adapter)
 session.mount("http://", adapter)
 
 
-_full_sdf_context: dict[str, Any] | None = None
+@functools.cache
+def get_sdf_context() -> dict[str, Any]:
+    path = get_config()["sdf_config_path"] / get_config()["context_file"]
+    return cast(dict[str, Any], _json.loads(path.read_bytes()))
 
 
-def get_sdf_context() -> dict[str, Any]:
-    global _full_sdf_context
-    if _full_sdf_context is None:
-        with (get_config()["sdf_config_path"] / get_config()["context_file"]).open(
-            "r"
-        ) as fo:
-            _full_sdf_context = json.load(fo)
-    return _full_sdf_context
+@functools.cache
+def _kairos_prefix() -> str:
+    """Return the expanded kairos prefix from the SDF @context."""
+    return cast(str, get_sdf_context()["@context"]["kairos"])
 
 
 class PydanticConfig:
@@ -190,33 +207,60 @@ def replace_kairos_prefix(j: object) -> None:
     ``kairos:``. It is more idiomatic to use the latter, so replace any
     occurrences of the former with it.
 
+    A top-level ``@context`` is left untouched since it defines the prefix.
+
     """
-    kairos_prefix = get_sdf_context()["@context"]["kairos"]
+    kairos_prefix = _kairos_prefix()
+    targets = j
+    if isinstance(j, dict) and "@context" in j:
+        targets = {k: v for k, v in j.items() if k != "@context"}
+    # Most documents are already abbreviated, and searching the serialized
+    # document is far cheaper than walking it
+    if kairos_prefix.encode() not in _json.dumpb(targets):
+        return
 
     def replace(s: object) -> object:
-        return s.replace(kairos_prefix, "kairos:") if isinstance(s, str) else s
+        # Only strings are passed in; most of them do not contain the prefix
+        s = cast(str, s)
+        return s.replace(kairos_prefix, "kairos:") if kairos_prefix in s else s
 
-    map_over_dict(j, replace, [str])
+    map_over_dict(targets, replace, [str])
+    if targets is not j:
+        cast(dict[str, object], j).update(cast(dict[str, object], targets))
 
 
 def map_over_dict(
     x: object, f: Callable[[object], object], accepted_types: list[type]
 ) -> object:
-    """Map a function over a primitive, dictionary, or list."""
-    if any(isinstance(x, t) for t in accepted_types):
+    """Map a function over a primitive, dictionary, or list.
+
+    Nested dictionaries and lists are modified in place.
+
+    """
+    types = tuple(accepted_types)
+    if isinstance(x, types):
         return f(x)
-    if isinstance(x, (dict, list)):
-        if isinstance(x, dict):
-            items = iter(x.items())
+    stack = [x]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            items: Iterable[tuple[str | int, object]] = container.items()
+        elif isinstance(container, list):
+            items = enumerate(container)
         else:
-            items = enumerate(x)
+            continue
+        _container = cast(MutableMapping["str | int", object], container)
         for k, v in items:
-            cast(MutableMapping["str | int", object], x)[k] = map_over_dict(
-                v, f, accepted_types
-            )
+            if isinstance(v, types):
+                _container[k] = f(v)
+            elif isinstance(v, (dict, list)):
+                stack.append(v)
     return x
 
 
+_SDF_VERSION_REGEX = re.compile(r"-v(.+)\.jsonld")
+
+
 def extract_sdf_version(context_file_name: str) -> str:
     """Extract the SDF version from the context filename.
 
@@ -229,105 +273,178 @@ def extract_sdf_version(context_file_name: str) -> str:
         If the regex does not match against the SDF context file name
 
     """
-    sdf_ver_match = re.search(r"-v(.+)\.jsonld", context_file_name)
-    if sdf_ver_match is not None and len(sdf_ver_match.groups()) > 0:
-        return sdf_ver_match.groups()[0]
+    sdf_ver_match = _SDF_VERSION_REGEX.search(context_file_name)
+    if sdf_ver_match is not None:
+        return sdf_ver_match.group(1)
     raise ValueError("Could not parse SDF context file path.")
 
 
 def get_schema_name(atId: str) -> str:
-    return atId.split("/")[-1]
+    return atId.rpartition("/")[2]
 
 
 def ensure_list(x: _T | list[_T]) -> list[_T]:
-    if not isinstance(x, list):
-        return [x]
+    # Values come from decoded JSON, so lists are never subclasses
+    if type(x) is not list:
+        return [cast(_T, x)]
     return x
 
 
 WIKIDATA_URL = "https://www.wikidata.org/w/api.php"
 
-_wd_cache: Any = {}
+WIKIDATA_BATCH_SIZE = 50
+"""Maximum number of QNodes the Wikidata API accepts per request"""
+
+WIKIDATA_BATCH_TIMEOUT = 5.0
+"""Timeout in seconds for a request of up to `WIKIDATA_BATCH_SIZE` QNodes"""
 
 
 def get_wikidata_item(wd_node: str) -> requests.Response:
     """Get metadata for QNode from Wikidata."""
+    return get_wikidata_items([wd_node], timeout=0.5)
+
+
+def get_wikidata_items(
+    wd_nodes: Iterable[str], timeout: float = WIKIDATA_BATCH_TIMEOUT
+) -> requests.Response:
+    """Get metadata for up to `WIKIDATA_BATCH_SIZE` QNodes from Wikidata.
+
+    Notes
+    -----
+    The Wikidata API returns an error for the whole request if any of the
+    QNodes are invalid.
+
+    """
     params = {
-        "ids": wd_node,
+        "ids": "|".join(wd_nodes),
         "action": "wbgetentities",
         "props": "labels|descriptions",
         "languages": "en",
         "format": "json",
     }
-    return session.get(WIKIDATA_URL, params=params, timeout=0.5)
+    return session.get(WIKIDATA_URL, params=params, timeout=timeout)
 
 
 def recursive_remove(
     obj: sdf.Document | dict[str, object] | list[Any], to_remove: set[str]
 ) -> None:
     """Remove specified keys in place in a possibly nested dict."""
-    if isinstance(obj, dict):
-        keys: Iterator[str | int] = iter(obj.keys())
-    elif isinstance(obj, list):
-        keys = iter(range(len(obj)))
-    else:
+    if not isinstance(obj, (dict, list)):
         raise ValueError()
-
-    _obj = cast(MutableMapping["str | int", object], obj)
-    to_del = []
-    for k in keys:
-        if k in to_remove:
-            to_del.append(k)
-        elif isinstance(_obj[k], (list, dict)):
-            v = cast("dict[str, object] | list[object]", _obj[k])
-            recursive_remove(v, to_remove)
-    # Just in case we are editing a list, don't let deletion mess up the indexing
-    for k in reversed(to_del):
-        del _obj[k]
+    stack: list[object] = [obj]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            for k in [k for k in container if k in to_remove]:
+                del container[k]
+            values: Iterable[object] = container.values()
+        elif isinstance(container, list):
+            values = container
+        else:
+            continue
+        stack.extend(v for v in values if isinstance(v, (list, dict)))
 
 
 def collect_ids(obj: object) -> list[str]:
     """Extract all JSON-LD @id fields in an SDF file."""
     ids = []
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if k == "@id":
-                ids.append(cast(str, v))
-            ids += collect_ids(v)
-    elif isinstance(obj, list):
-        for item in obj:
-            ids += collect_ids(item)
+    # Items are pushed in reverse so that @id's are found in document order
+    stack: list[tuple[object, object]] = [(None, obj)]
+    while stack:
+        k, v = stack.pop()
+        if k == "@id":
+            ids.append(cast(str, v))
+        if isinstance(v, dict):
+            stack.extend(reversed(v.items()))
+        elif isinstance(v, list):
+            stack.extend((None, item) for item in reversed(v))
     return ids
 
 
 def sub_id(obj: object, target: str, replacement: str) -> None:
     """Replace @id references in non-@id fields."""
-    if isinstance(obj, dict):
-        keys = list(obj.keys())
-    elif isinstance(obj, list):
-        keys = list(range(len(obj)))
-    else:
+    sub_ids(obj, {target: replacement})
+
+
+def sub_ids(obj: object, substitutions: Mapping[str, str]) -> None:
+    """Replace multiple @id references in non-@id fields in a single pass.
+
+    Each value which is a key of ``substitutions`` is replaced by the
+    corresponding value; replacements are not themselves substituted.
+
+    """
+    if not isinstance(obj, (dict, list)):
         raise ValueError()
-    for k in keys:
-        _obj = cast("MutableMapping[str | int, object]", obj)
-        if k != "@id" and _obj[k] == target:
-            _obj[k] = replacement
-        elif isinstance(_obj[k], (list, dict)):
-            sub_id(_obj[k], target, replacement)
-
-
-def ensure_unique_ids(top_level_obj: object, obj: object, all_ids: set[str]) -> None:
-    """Ensure that there are no duplicate JSON-LD @id's."""
-    if isinstance(obj, dict):
-        for k, v in obj.items():
-            if k == "@id":
-                new_v = ensure_valid_cmu_id(all_ids, v)
-                obj[k] = new_v
-                sub_id(top_level_obj, v, new_v)
-            ensure_unique_ids(top_level_obj, v, all_ids)
-    elif isinstance(obj, list):
-        for item in obj:
-            ensure_unique_ids(top_level_obj, item, all_ids)
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            items: Iterable[tuple[str | int, object]] = container.items()
+        else:
+            items = enumerate(container)
+        _container = cast("MutableMapping[str | int, object]", container)
+        for k, v in items:
+            if k != "@id" and isinstance(v, str) and v in substitutions:
+                _container[k] = substitutions[v]
+            elif isinstance(v, (list, dict)):
+                stack.append(v)
+
+
+IdRefIndex = dict[str, list[tuple[MutableMapping["str | int", object], "str | int"]]]
+
+
+def index_id_refs(obj: object) -> IdRefIndex:
+    """Index where each string value occurs in non-@id fields.
+
+    The index maps each string to the ``(container, key)`` pairs holding it,
+    so that @id references can be substituted without re-walking ``obj``.
+
+    """
+    index: IdRefIndex = {}
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            items: Iterable[tuple[str | int, object]] = container.items()
+        elif isinstance(container, list):
+            items = enumerate(container)
+        else:
+            continue
+        _container = cast(MutableMapping["str | int", object], container)
+        for k, v in items:
+            if isinstance(v, str):
+                if k != "@id":
+                    index.setdefault(v, []).append((_container, k))
+            elif isinstance(v, (dict, list)):
+                stack.append(v)
+    return index
+
+
+def ensure_unique_ids(
+    top_level_obj: object,
+    obj: object,
+    all_ids: set[str],
+    collision_counts: dict[str, int] | None = None,
+) -> None:
+    """Ensure that there are no duplicate JSON-LD @id's.
+
+    See `ensure_valid_cmu_id` for ``all_ids`` and ``collision_counts``.
+
+    """
+    if collision_counts is None:
+        collision_counts = {}
+    # Items are pushed in reverse so that @id's are visited in document order
+    stack: list[tuple[Any, object, Any]] = [(None, None, obj)]
+    while stack:
+        parent, k, v = stack.pop()
+        if k == "@id":
+            new_v = ensure_valid_cmu_id(all_ids, v, collision_counts)
+            parent[k] = new_v
+            sub_id(top_level_obj, v, new_v)
+        if isinstance(v, dict):
+            stack.extend((v, kk, vv) for kk, vv in reversed(v.items()))
+        elif isinstance(v, list):
+            stack.extend((None, None, item) for item in reversed(v))
 
 
 # https://www.w3.org/Addressing/URL/5_URI_BNF.html
@@ -339,22 +456,47 @@ CMU_ID_REGEX = re.compile(f"^cmu:[{ACCEPTABLE_CHARS}/]*[{ACCEPTABLE_CHARS}]$")
 FILLER_CHAR = "$"
 
 
-def ensure_valid_cmu_id(all_ids: set[str], s: str) -> str:
-    """Ensure that @id's are both valid IRI's and have a CMU prefix."""
+class _SanitizeTable(dict[int, int]):
+    """`str.translate` table replacing unacceptable characters with filler"""
+
+    def __missing__(self, key: int) -> int:
+        return ord(FILLER_CHAR)
+
+
+# Acceptable characters are all ASCII and map to themselves
+_SANITIZE_TABLE = _SanitizeTable(
+    (c, c) for c in range(128) if re.match(f"[{ACCEPTABLE_CHARS}/]", chr(c))
+)
+
+
+def ensure_valid_cmu_id(
+    all_ids: set[str], s: str, collision_counts: dict[str, int] | None = None
+) -> str:
+    """Ensure that @id's are both valid IRI's and have a CMU prefix.
+
+    The returned @id is made unique by adding a numeric suffix if necessary
+    and is then added to ``all_ids``. ``collision_counts`` records the next
+    suffix to try for each @id; passing the same dict along with ``all_ids``
+    across calls avoids rescanning suffixes which are already taken.
+
+    """
     if not is_valid_cmu_id(s):
         if s[-1] == "/":
             s += FILLER_CHAR
         if s[:4] != "cmu:":
             s = "cmu:" + s
-        s = "cmu:" + re.sub(f"[^{ACCEPTABLE_CHARS}/]", FILLER_CHAR, s[4:])
-
-    i = 1
-    suffix = ""
-    while s + suffix in all_ids:
-        suffix = f"_{i}"
+        s = "cmu:" + s[4:].translate(_SANITIZE_TABLE)
+
+    if collision_counts is None:
+        collision_counts = {}
+    # Suffixes below the recorded count are already in all_ids
+    i = collision_counts.get(s, 0)
+    new_s = f"{s}_{i}" if i else s
+    while new_s in all_ids:
         i += 1
+        new_s = f"{s}_{i}"
+    collision_counts[s] = i + 1
 
-    new_s = s + suffix
     all_ids.add(new_s)
     return new_s
 
@@ -362,13 +504,14 @@ def ensure_valid_cmu_id(all_ids: set[str], s: str) -> str:
 def fix_atIds(lib: sdf.Document, use_uuids: bool = False) -> None:
     """Replace @id's with official @id format."""
     counter = 0
+    refs = index_id_refs(lib)
 
     def fix_for_ke_type(ke_type: str, instances: list[Any]) -> None:
         nonlocal counter
         for x in instances:
             if ke_type == "Participants":
                 # Suggestion: Add event name
-                name = x["entity"].split("/")[-1]
+                name = x["entity"].rpartition("/")[2]
             elif ke_type == "Relations":
                 name = x["wd_label"].replace(" ", "_")
             else:
@@ -378,20 +521,22 @@ def fix_atIds(lib: sdf.Document, use_uuids: bool = False) -> None:
                 x["@id"] = str(uuid.uuid4())
             else:
                 x["@id"] = f"cmu:{ke_type}/{counter:05d}/{name}"
-            sub_id(lib, old_atId, x["@id"])
+            # Equivalent to sub_id(lib, old_atId, x["@id"])
+            moved = refs.pop(old_atId, [])
+            for container, k in moved:
+                container[k] = x["@id"]
+            refs.setdefault(x["@id"], []).extend(moved)
             counter += 1
 
+    events = ensure_list(lib["events"])
     fix_for_ke_type("Entities", ensure_list(lib["entities"]))
-    fix_for_ke_type("Events", ensure_list(lib["events"]))
+    fix_for_ke_type("Events", events)
     fix_for_ke_type("Relations", ensure_list(lib.get("relations", [])))
     fix_for_ke_type("Instances", ensure_list(lib.get("instances", [])))
 
-    participants = [
-        participant
-        for event in ensure_list(lib["events"])
-        if "participants" in event
-        for participant in event["participants"]
-    ]
+    participants: list[Any] = []
+    for event in events:
+        participants.extend(event.get("participants", ()))
     fix_for_ke_type("Participants", participants)
 
 
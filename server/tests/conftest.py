@@ -0,0 +1,43 @@
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+import falcon
+from falcon import testing
+
+from openera import db
+from openera import server
+
+
+@pytest.fixture(scope="session")
+def _app() -> Any:
+    # Constructing an app is comparatively expensive, so share one
+    return falcon.API()
+
+
+@pytest.fixture
+def app(_app: Any) -> Any:
+    """A falcon app with no routes"""
+    router = falcon.routing.DefaultRouter()
+    _app._router = router
+    _app._router_search = router.find
+    return _app
+
+
+@pytest.fixture
+def tmp_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Run in a temporary directory with an empty database"""
+    server_dir = Path(__file__).resolve().parent.parent
+    (tmp_path / "sdf-config").symlink_to(server_dir / "sdf-config")
+    (tmp_path / "fsdb").mkdir()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delattr(db._tls, "con", raising=False)
+    db.init_db()
+    yield tmp_path
+    db._get_connection().close()
+    del db._tls.con
+
+
+@pytest.fixture
+def client() -> Any:
+    return testing.TestClient(server.app)
@@ -0,0 +1,45 @@
+from pathlib import Path
+import json
+
+import pytest
+
+from openera import db
+
+
+def _write_blank(name: str) -> None:
+    with db.do_transaction() as txn:
+        txn.write_new_schema(db.create_blank_schema(name))
+
+
+def test_schema_summaries(tmp_db: Path) -> None:
+    assert json.loads(db.get_schema_summaries()) == []
+    _write_blank("a")
+    expected = [{"schemaId": "cmu:Schema/a", "tags": []}]
+    assert json.loads(db.get_schema_summaries()) == expected
+    # Served from the cache
+    assert db.get_schema_summaries() is db.get_schema_summaries()
+
+
+def _reconnect() -> None:
+    db._get_connection().close()
+    del db._tls.con
+
+
+def test_schema_summaries_new_connection(
+    tmp_db: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _write_blank("a")
+    _reconnect()
+    assert json.loads(db.get_schema_summaries()) != []
+
+    # A fresh connection to a different, empty database reports the same
+    # data_version/total_changes as the previous fresh connection did
+    other = tmp_path_factory.mktemp("other")
+    (other / "sdf-config").symlink_to(tmp_db / "sdf-config")
+    (other / "fsdb").mkdir()
+    _reconnect()
+    monkeypatch.chdir(other)
+    db.init_db()
+    assert json.loads(db.get_schema_summaries()) == []
@@ -0,0 +1,49 @@
+import json
+import math
+
+import pytest
+
+from openera import _json
+from openera import db
+
+
+def test_roundtrip_exact() -> None:
+    x = {"a": [1, 2.5, None], "b": "café", "c": {"d": True}}
+    assert _json.loads(_json.dumpb(x)) == x
+    assert _json.loads(_json.dumps(x, indent=2)) == x
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"x": NaN, "y": null}',
+        '{"x": [Infinity, -Infinity]}',
+        '{"x": "\\ud800"}',
+        '{"x": 123456789012345678901234567890}',
+    ],
+)
+def test_stdlib_compatible(text: str) -> None:
+    # Documents the stdlib json module wrote must read back and write the same
+    x = _json.loads(text)
+    assert json.dumps(x) == json.dumps(json.loads(text))
+    assert json.dumps(_json.loads(_json.dumpb(x))) == json.dumps(x)
+    assert json.dumps(_json.loads(_json.dumps(x))) == json.dumps(x)
+
+
+def test_dumpb_nan() -> None:
+    x = _json.loads(_json.dumpb({"x": float("nan"), "y": None}))
+    assert math.isnan(x["x"]) and x["y"] is None
+
+
+def test_invalid() -> None:
+    with pytest.raises(_json.JSONDecodeError):
+        _json.loads("{bad")
+    with pytest.raises(_json.JSONDecodeError):
+        _json.loads(b"[1, 2")
+
+
+def test_check_schema_nan_surrogate() -> None:
+    # Schemas stored by the stdlib json module are not quarantined
+    doc = db.create_blank_schema("test")
+    doc["privateData"]["eratosthenes"] = {"score": float("nan"), "note": "\ud800"}
+    assert db._check_schema((doc["@id"], json.dumps(doc))) == (doc["@id"], None)
@@ -0,0 +1,38 @@
+from pathlib import Path
+from typing import Any
+
+from openera import db
+from openera import util
+
+
+def test_put_replaces_kairos_prefix(tmp_db: Path, client: Any) -> None:
+    prefix = util.get_sdf_context()["@context"]["kairos"]
+    doc: Any = db.create_blank_schema("prefixed")
+    doc["entities"] = [{"@id": f"{prefix}Entities/e1", "name": "e1"}]
+    doc["events"] = [
+        {
+            "@id": f"{prefix}Events/ev1",
+            "name": "ev1",
+            "participants": [
+                {
+                    "@id": f"{prefix}Participants/p1",
+                    "roleName": "r",
+                    "entity": f"{prefix}Entities/e1",
+                }
+            ],
+        }
+    ]
+    resp = client.simulate_put(
+        "/api/schemas/cmu:Schema_FSLASH_prefixed",
+        json={"sdf": doc, "clientId": "c1"},
+    )
+    assert resp.status_code == 201
+
+    stored: Any = db.get_schema("cmu:Schema/prefixed")
+    assert stored["entities"][0]["@id"] == "kairos:Entities/e1"
+    event = stored["events"][0]
+    assert event["@id"] == "kairos:Events/ev1"
+    assert event["participants"][0]["@id"] == "kairos:Participants/p1"
+    assert event["participants"][0]["entity"] == "kairos:Entities/e1"
+    # The context defining the prefix is left alone
+    assert stored["@context"] == doc["@context"]
@@ -1,7 +1,6 @@
 from typing import Any, TypedDict
 
 import pytest
-import falcon
 
 from openera import util
 
@@ -40,8 +39,7 @@ class TestUriConverter:
 class TestCreateApi:
     resource = object()
 
-    def test_simple(self) -> None:
-        app = falcon.API()
+    def test_simple(self, app: Any) -> None:
         spec = {
             "x": 2,
             "y": 3,
@@ -50,8 +48,7 @@ class TestCreateApi:
         assert app._router.find("/foo/x")[0] == 2
         assert app._router.find("/foo/y")[0] == 3
 
-    def test_nested(self) -> None:
-        app = falcon.API()
+    def test_nested(self, app: Any) -> None:
         spec = {
             "x": {
                 "y": 3,
@@ -60,8 +57,7 @@ class TestCreateApi:
         util.create_api(app, "/foo", spec)
         assert app._router.find("/foo/x/y")[0] == 3
 
-    def test_empty(self) -> None:
-        app = falcon.API()
+    def test_empty(self, app: Any) -> None:
         spec = {
             "x": {
                 "": 3,
@@ -112,6 +108,12 @@ def test_replace_kairos_prefix() -> None:
     util.replace_kairos_prefix(x)
     assert x == y
 
+    context = {"kairos": prefix}
+    x = {"@context": context, "@id": f"{prefix}foo", "b": [f"{prefix}bar"]}
+    util.replace_kairos_prefix(x)
+    assert x == {"@context": context, "@id": "kairos:foo", "b": ["kairos:bar"]}
+    assert list(x) == ["@context", "@id", "b"]
+
 
 class TestMapOverDict:
     def test_singleton(self) -> None:
@@ -190,3 +192,18 @@ class TestExtractSdfVersion:
 def test_get_schema_name() -> None:
     x = "a/b/c/d"
     assert "d" == util.get_schema_name(x)
+
+
+def test_sub_ids() -> None:
+    x = {
+        "@id": "a",
+        "b": "a",
+        "c": ["a", {"d": "e"}, "f"],
+    }
+    y = {
+        "@id": "a",
+        "b": "e",
+        "c": ["e", {"d": "g"}, "f"],
+    }
+    util.sub_ids(x, {"a": "e", "e": "g"})
+    assert x == y
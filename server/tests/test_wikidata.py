@@ -0,0 +1,110 @@
+from pathlib import Path
+from typing import Any, Callable
+import json
+import threading
+
+import pytest
+
+from openera import db
+from openera import resources
+from openera import util
+
+
+class FakeResponse:
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+
+class FakeSession:
+    """Answer ``wbgetentities`` requests with a label and description per id"""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], Any]] = []
+        self.on_get: Callable[[list[str]], None] | None = None
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: dict[str, str], timeout: Any) -> FakeResponse:
+        ids = params["ids"].split("|")
+        with self._lock:
+            self.calls.append((ids, timeout))
+        if self.on_get is not None:
+            self.on_get(ids)
+        entities = {
+            i: {
+                "labels": {"en": {"value": f"label {i}"}},
+                "descriptions": {"en": {"value": f"desc {i}"}},
+            }
+            for i in ids
+        }
+        return FakeResponse(json.dumps({"entities": entities}).encode())
+
+
+@pytest.fixture
+def session(tmp_db: Path, monkeypatch: pytest.MonkeyPatch) -> FakeSession:
+    """Use an empty database and a fake Wikidata session"""
+    fake = FakeSession()
+    monkeypatch.setattr(util, "session", fake)
+    return fake
+
+
+def test_values_many_cache_hit(session: FakeSession) -> None:
+    with db.do_transaction() as txn:
+        txn.execute("insert into wd_node values (?,?,?)", ("Q1", "one", "first"))
+    assert db.get_wikidata_values_many(["Q1", "Q1"]) == {"Q1": ("one", "first")}
+    assert session.calls == []
+
+
+def test_values_many_batches(session: FakeSession) -> None:
+    nodes = [f"Q{i}" for i in range(71)]
+    values = db.get_wikidata_values_many(nodes)
+    assert values == {n: (f"label {n}", f"desc {n}") for n in nodes}
+    sizes = sorted(len(ids) for ids, _ in session.calls)
+    assert sizes == [21, util.WIKIDATA_BATCH_SIZE]
+    assert all(t == util.WIKIDATA_BATCH_TIMEOUT for _, t in session.calls)
+
+    # Fetched values are cached
+    session.calls.clear()
+    assert db.get_wikidata_values_many(nodes) == values
+    assert session.calls == []
+
+
+def test_values_many_concurrent_write(session: FakeSession) -> None:
+    def seed(ids: list[str]) -> None:
+        # Another worker caches one of the QNodes while this one is fetching
+        with db.do_transaction() as txn:
+            txn.execute("insert into wd_node values (?,?,?)", ("Q1", "one", "first"))
+
+    session.on_get = seed
+    values = db.get_wikidata_values_many(["Q1", "Q2"])
+    assert values == {"Q1": ("label Q1", "desc Q1"), "Q2": ("label Q2", "desc Q2")}
+    rows = db.execute("select node, label from wd_node order by node")
+    assert [tuple(r) for r in rows] == [("Q1", "one"), ("Q2", "label Q2")]
+
+
+def test_batch_endpoint(session: FakeSession, client: Any) -> None:
+    with db.do_transaction() as txn:
+        txn.execute("insert into wd_node values (?,?,?)", ("Q1", "one", "first"))
+    resp = client.simulate_post("/api/wikidata", json={"ids": ["Q1", "Q2"]})
+    assert resp.status_code == 200
+    assert resp.json == {
+        "Q1": {"label": "one", "description": "first"},
+        "Q2": {"label": "label Q2", "description": "desc Q2"},
+    }
+    assert [ids for ids, _ in session.calls] == [["Q2"]]
+
+
+@pytest.mark.parametrize("body", [{}, [], {"ids": "Q12"}, {"ids": ["Q1", 2]}])
+def test_batch_endpoint_bad_body(session: FakeSession, client: Any, body: Any) -> None:
+    resp = client.simulate_post("/api/wikidata", json=body)
+    assert resp.status_code == 400
+    assert session.calls == []
+
+
+def test_batch_endpoint_too_many_ids(session: FakeSession, client: Any) -> None:
+    ids = [f"Q{i}" for i in range(resources.WIKIDATA_BATCH_MAX_IDS + 1)]
+    resp = client.simulate_post("/api/wikidata", json={"ids": ids})
+    assert resp.status_code == 400
+    assert session.calls == []
+    resp = client.simulate_post("/api/wikidata", json={"ids": ids[:-1]})
+    assert resp.status_code == 200
+    assert len(resp.json) == resources.WIKIDATA_BATCH_MAX_IDS